@@ -1,9 +1,23 @@
+import random
+import time
+
 from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from app.config import DATABASE_URL
+from app.config import DATABASE_URL, DB_MAX_OVERFLOW, DB_POOL_SIZE
 
-engine = create_engine(DATABASE_URL)
+# Explicit pool sizing: the defaults (pool_size=5, max_overflow=10) stall
+# concurrent ingest workers on pool checkout. LIFO checkout keeps hot
+# connections warm so idle ones can age out via pool_recycle.
+engine = create_engine(
+    DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -15,5 +29,20 @@ def get_db():
     finally:
         db.close()
 
-def init_db():
-    Base.metadata.create_all(bind=engine)
+def init_db(max_attempts: int = 5, base_delay: float = 0.5):
+    """
+    Create tables, retrying while the database comes up (e.g. compose
+    startup ordering). A cheap connect probe fails fast before create_all,
+    and retries back off exponentially with jitter to avoid thundering herd.
+    """
+    for attempt in range(1, max_attempts + 1):
+        try:
+            with engine.connect():
+                pass
+            Base.metadata.create_all(bind=engine)
+            return
+        except OperationalError:
+            if attempt == max_attempts:
+                raise
+            delay = base_delay * (2 ** (attempt - 1)) + random.uniform(0, base_delay)
+            time.sleep(delay)
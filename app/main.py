@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import functools
 import hashlib
+import heapq
+import html
 import logging
 import os
 import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from io import BytesIO
-from typing import Any, Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import re
 import string
 import unicodedata
 from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, RedirectResponse
 
 try:
@@ -30,12 +37,18 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-from app.observation_registry import canonical_fields, required_field_keys
+from app.observation_registry import (
+    canonical_fields,
+    field_index,
+    required_field_key_set,
+    required_field_keys,
+)
 from app.observation_store import (
     add_doc_to_case,
     delete_override,
+    document_exists,
     ensure_doc_dirs,
-    get_case_doc_ids,
+    load_cases,
     load_ingestion_runs,
     load_observations,
     load_overrides,
@@ -58,53 +71,164 @@ LOW_TEXT_THRESHOLD = int(os.getenv("LOW_TEXT_THRESHOLD", "120"))
 # Minimal text threshold for OCR trigger (stripped text length)
 OCR_TEXT_THRESHOLD = int(os.getenv("OCR_TEXT_THRESHOLD", "50"))
 
+# Tesseract worker threads for multi-page OCR; 0 = one per CPU core
+OCR_MAX_WORKERS = int(os.getenv("OCR_MAX_WORKERS", "0"))
+
+# Rasterization DPI for OCR. Rendering and Tesseract cost scale with the
+# square of this; 200 is usually adequate for digitally-born PDFs if speed
+# matters more than fidelity.
+OCR_DPI = int(os.getenv("OCR_DPI", "300"))
+
 # Anchors used to detect semantic vs non-semantic native text layer (case-insensitive)
 ANCHOR_STRINGS = ["transunion", "accounts summary", "personal information", "credit report"]
 
+# All anchors unioned into one case-insensitive alternation: a page is
+# scanned once instead of once per anchor, with no .lower() copy.
+ANCHOR_RE = re.compile("|".join(re.escape(a) for a in ANCHOR_STRINGS), re.IGNORECASE)
+
+# Letter runs for semantic metrics (compiled once at import, not per page).
+# One finditer pass over these yields both the ASCII letter count and the
+# word count (runs of length >= 3). ASCII-only pages — the common case —
+# scan the encoded bytes with the bytes twin, skipping per-character
+# Unicode handling.
+LETTER_RUN_RE = re.compile(r"[A-Za-z]+")
+LETTER_RUN_BYTES_RE = re.compile(rb"[A-Za-z]+")
+
+# Deletion tables for ASCII page-quality counting: bytes.translate(None, ...)
+# strips the listed bytes in one C pass, so len() before/after gives counts
+# without a per-character Python loop.
+ASCII_NON_LETTERS = bytes(c for c in range(256) if not (0x41 <= c <= 0x5A or 0x61 <= c <= 0x7A))
+ASCII_WHITESPACE = b" \t\n\r\x0b\x0c"
+# Deletion table for the printable-ratio count: everything that is neither
+# printable ASCII (0x20-0x7E) nor \t\n\r.
+ASCII_UNPRINTABLE = bytes(
+    c for c in range(256) if not (0x20 <= c <= 0x7E or c in (0x09, 0x0A, 0x0D))
+)
+
+# Common English words for the page-quality check, unioned into one
+# case-insensitive alternation (substring semantics, same as the original
+# per-word `in` scans) so the page is scanned once instead of once per word.
+COMMON_WORDS = ["the", "and", "of", "to", "in", "a", "is", "it", "you", "that", "he", "was"]
+COMMON_WORDS_RE = re.compile("|".join(COMMON_WORDS), re.IGNORECASE)
+
+# Translate table for normalize_text's ASCII fast path: every non-printable
+# ASCII codepoint except \n\r\t maps to a space, so the per-character Python
+# loop becomes one C-level str.translate call.
+ASCII_NORMALIZE_TABLE = {
+    cp: " " for cp in range(128)
+    if not (0x20 <= cp <= 0x7E) and cp not in (0x09, 0x0A, 0x0D)
+}
+
+# TransUnion bureau-detection keywords, unioned into one compiled alternation
+# so the whole-document scan makes a single pass instead of one per keyword.
+TRANSUNION_KEYWORDS = ["transunion", "credit report", "accounts summary", "personal information"]
+TRANSUNION_KEYWORDS_RE = re.compile(
+    "|".join(re.escape(k) for k in TRANSUNION_KEYWORDS), re.IGNORECASE
+)
+EQUIFAX_KEYWORD_RE = re.compile(r"equifax", re.IGNORECASE)
+
+# Identity fields that must always be represented in the observation set,
+# even if only as explicit "missing" observations.
+REQUIRED_IDENTITY_FIELD_KEYS = frozenset({
+    "consumer.full_name",
+    "consumer.current_address.line1",
+    "consumer.current_address.city",
+    "consumer.current_address.province",
+    "consumer.current_address.postal_code",
+})
+
+# Inquiry section scanning patterns (compiled once at import, not per page).
+# Date formats are unioned into a single alternation so each line is scanned
+# once instead of once per format.
+INQUIRY_HEADER_RE = re.compile(r"\bInquiries\b", re.IGNORECASE)
+INQUIRY_STOP_HEADER_RE = re.compile(
+    r"^\s*(Tradelines|Accounts|Collections|Public Records|Personal Information|Summary)\b",
+    re.IGNORECASE
+)
+# Multiline twin of the stop-header check, used to find where the Inquiries
+# section ends in the full page text without splitting it into lines.
+# [ \t\r]* instead of \s* keeps the anchor from crossing newlines.
+INQUIRY_STOP_HEADER_LINE_RE = re.compile(
+    r"^[ \t\r]*(Tradelines|Accounts|Collections|Public Records|Personal Information|Summary)\b",
+    re.IGNORECASE | re.MULTILINE,
+)
+INQUIRY_DATE_RE = re.compile(
+    r"\b("
+    r"\d{4}-\d{2}-\d{2}"            # YYYY-MM-DD
+    r"|\d{1,2}/\d{1,2}/\d{2,4}"     # M/D/YY(YY)
+    r"|\d{1,2}-\d{1,2}-\d{2,4}"     # M-D-YY(YY)
+    r")\b"
+)
+
+# Inquiry subscriber-name heuristics (compiled once at import, not per line)
+INQUIRY_DATE_YMD_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
+INQUIRY_DATE_MDY_RE = re.compile(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b")
+SUBSCRIBER_LABEL_RE = re.compile(r"\b(Subscriber|Member|Company|Creditor)\b", re.IGNORECASE)
+SUBSCRIBER_LABEL_VALUE_RE = re.compile(
+    r"\b(Subscriber|Member|Company|Creditor)\s*[:\-]?\s*(.+)", re.IGNORECASE
+)
+
+# Whitespace-normalization passes (compiled once at import, not per call).
+# WS_FUSED_RE grabs a whole space/tab/newline run (excluding \r) in one scan;
+# the replacement keeps a space for newline-free runs, one newline for a
+# single-newline run, and two for anything more.
+WHITESPACE_RUN_RE = re.compile(r"\s+")
+WS_FUSED_RE = re.compile(r"[ \t]*\n[ \t\n]*|[ \t]+")
+
+
+def _ws_fused_replace(m: "re.Match[str]") -> str:
+    newlines = m.group().count("\n")
+    if newlines == 0:
+        return " "
+    return "\n" if newlines == 1 else "\n\n"
+
+
+OCR_FLAG_NAMES = ("FORCE_OCR", "ENABLE_OCR", "OCR_ENABLED", "USE_OCR")
+OCR_FALSE_VALUES = frozenset({"0", "false", "no", ""})
+
+# Memoized flag decision keyed on the raw env values, so repeated uploads
+# skip re-normalizing unchanged flags while env changes (tests monkeypatch
+# these per request) are still honored.
+_ocr_flags_env: Optional[Tuple[Optional[str], ...]] = None
+_ocr_flags: Tuple[bool, bool] = (False, False)
+
+
+def _is_truthy_flag(value: Optional[str]) -> bool:
+    if value is None:
+        return False
+    # Any non-empty value outside the false set is considered truthy
+    return str(value).strip().casefold() not in OCR_FALSE_VALUES
+
 
 def is_ocr_enabled() -> Tuple[bool, bool]:
     """
     Check if OCR is enabled via environment flags.
     Checks: ENABLE_OCR, OCR_ENABLED, USE_OCR, FORCE_OCR
     Treats common false values as false (case-insensitive): "0", "false", "no", "", None
-    Treats as true: "1", "true", "yes"
-    
+
     Returns: (ocr_enabled: bool, force_ocr: bool)
     - If FORCE_OCR is truthy => ocr_enabled=True and force_ocr=True
     - Else ocr_enabled = any(ENABLE_OCR, OCR_ENABLED, USE_OCR) truthy, force_ocr=False
     - Default is (False, False) if none provided
     """
-    false_values = {"0", "false", "False", "no", "No", "NO", ""}
-    true_values = {"1", "true", "True", "yes", "Yes", "YES"}
-    
-    def is_truthy(value: Optional[str]) -> bool:
-        if value is None:
-            return False
-        value_str = str(value).strip()
-        if not value_str:
-            return False
-        if value_str.lower() in false_values:
-            return False
-        if value_str.lower() in true_values:
-            return True
-        # Any non-empty value not in false_values is considered truthy
-        return True
-    
-    # Check FORCE_OCR first (highest precedence)
-    force_ocr_val = os.getenv("FORCE_OCR")
-    force_ocr = is_truthy(force_ocr_val)
-    
-    if force_ocr:
-        return (True, True)
-    
-    # Check other flags
-    enable_ocr = is_truthy(os.getenv("ENABLE_OCR"))
-    ocr_enabled = is_truthy(os.getenv("OCR_ENABLED"))
-    use_ocr = is_truthy(os.getenv("USE_OCR"))
-    
-    ocr_enabled_result = enable_ocr or ocr_enabled or use_ocr
-    
-    return (ocr_enabled_result, False)
+    global _ocr_flags_env, _ocr_flags
+
+    raw = tuple(os.getenv(name) for name in OCR_FLAG_NAMES)
+    if raw == _ocr_flags_env:
+        return _ocr_flags
+
+    force_ocr_val, enable_val, enabled_val, use_val = raw
+    if _is_truthy_flag(force_ocr_val):
+        flags = (True, True)
+    else:
+        flags = (
+            _is_truthy_flag(enable_val) or _is_truthy_flag(enabled_val) or _is_truthy_flag(use_val),
+            False,
+        )
+
+    _ocr_flags_env = raw
+    _ocr_flags = flags
+    return flags
 
 
 @app.get("/", include_in_schema=False)
@@ -112,11 +236,10 @@ def root():
     return RedirectResponse(url="/ui")
 
 
-@app.get("/ui", response_class=HTMLResponse, include_in_schema=False)
-def ui():
-    # Minimal, dependency-free upload UI (single file)
-    return HTMLResponse(
-        """
+# Minimal, dependency-free upload UI (single file). The page is fully static,
+# so the response is built once at import rather than per request.
+UI_HTML = HTMLResponse(
+    """
 <!doctype html>
 <html lang="en">
 <head>
@@ -254,27 +377,328 @@ def ui():
   </script>
 </body>
 </html>
-        """.strip()
-    )
+    """.strip()
+)
 
 
-@app.get("/documents/{doc_id}/review", response_class=HTMLResponse, include_in_schema=False)
-def review_ui(doc_id: str):
-    """Human review UI for editing document fields and managing overrides."""
-    # Verify document exists
-    data = load_observations(OBSERVATIONS_DIR, doc_id)
-    if not data:
-        raise HTTPException(status_code=404, detail="Document observations not found")
+@app.get("/ui", response_class=HTMLResponse, include_in_schema=False)
+def ui():
+    return UI_HTML
+
+
+# Review-page section for each field-key prefix (the part before the first
+# dot); anything unlisted lands in "Other".
+SECTION_BY_PREFIX = {
+    "report": "Report Info",
+    "consumer": "Consumer Identity",
+    "tradeline": "Tradelines",
+    "inquiry": "Inquiries",
+    "collection": "Collections",
+    "public_record": "Public Records",
+    "fraud_alert": "Alerts & Statements",
+    "consumer_statement": "Alerts & Statements",
+}
+
+# Static chunks of the review page, built once at import. Only the small
+# dynamic slots (doc_id, quality status, section/field rows) are formatted
+# per request; the style and script shells are joined in unchanged.
+REVIEW_STYLE = """\
+  <style>
+    body { font-family: system-ui, -apple-system, Segoe UI, Roboto, Arial, sans-serif; margin: 24px; background: #f5f5f5; }
+    .container { max-width: 1200px; margin: 0 auto; }
+    .header { background: white; padding: 20px; border-radius: 10px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+    .header h1 { margin: 0 0 10px 0; }
+    .header .doc-id { font-family: monospace; color: #666; }
+    .quality-status { display: inline-block; padding: 6px 12px; border-radius: 6px; font-weight: bold; margin-top: 10px; }
+    .quality-status.ok { background: #15803d; color: white; }
+    .quality-status.needs_review { background: #b45309; color: white; }
+    .missing-fields { background: #fee; border: 2px solid #fcc; padding: 16px; border-radius: 10px; margin-bottom: 20px; }
+    .missing-fields h3 { margin-top: 0; color: #c00; }
+    .missing-fields ul { margin: 10px 0; }
+    .missing-fields code { background: #fcc; padding: 2px 6px; border-radius: 4px; }
+    .section { background: white; padding: 20px; border-radius: 10px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+    .section h3 { margin-top: 0; border-bottom: 2px solid #ddd; padding-bottom: 10px; }
+    .field-row { margin: 16px 0; padding: 16px; background: #fafafa; border-radius: 8px; border-left: 4px solid #ddd; }
+    .field-row:hover { background: #f5f5f5; }
+    .field-label { margin-bottom: 8px; }
+    .field-label strong { font-size: 16px; }
+    .field-key { font-family: monospace; font-size: 12px; color: #666; margin-left: 8px; }
+    .required-badge { background: #c00; color: white; padding: 2px 6px; border-radius: 4px; font-size: 11px; margin-left: 8px; }
+    .field-controls { display: flex; gap: 10px; align-items: center; flex-wrap: wrap; margin: 8px 0; }
+    .field-input { flex: 1; min-width: 300px; padding: 8px 12px; border: 2px solid #ddd; border-radius: 6px; font-size: 14px; }
+    .field-input:focus { outline: none; border-color: #0b66c3; }
+    .status-badge { padding: 4px 8px; border-radius: 4px; font-size: 12px; font-weight: bold; }
+    .status-extracted { background: #dbeafe; color: #1e40af; }
+    .status-override { background: #fef3c7; color: #92400e; }
+    .status-missing { background: #fee2e2; color: #991b1b; }
+    .confidence { font-size: 12px; color: #666; }
+    button { padding: 8px 16px; border-radius: 6px; border: none; cursor: pointer; font-size: 14px; font-weight: 500; }
+    .btn-save { background: #15803d; color: white; }
+    .btn-save:hover { background: #16a34a; }
+    .btn-save:disabled { background: #ccc; cursor: not-allowed; }
+    .btn-clear { background: #dc2626; color: white; }
+    .btn-clear:hover { background: #ef4444; }
+    .field-provenance { font-size: 12px; color: #666; margin-top: 8px; font-style: italic; }
+    .saving { opacity: 0.6; pointer-events: none; }
+    .message { padding: 12px; border-radius: 6px; margin: 10px 0; }
+    .message.success { background: #d1fae5; color: #065f46; }
+    .message.error { background: #fee2e2; color: #991b1b; }
+    a { color: #0b66c3; text-decoration: none; }
+    a:hover { text-decoration: underline; }
+  </style>"""
+
+REVIEW_SCRIPT_PREFIX = '''\
+  <script>
+    const base = window.location.origin;
+    const docId = "'''
+
+REVIEW_SCRIPT_SUFFIX = """\
+";
     
-    # Load resolved data with overrides
-    if isinstance(data, list):
-        observations = data
-    else:
-        observations = data.get("observations", [])
+    // Track original values to detect changes
+    const originalValues = {};
+    document.querySelectorAll('.field-input').forEach(input => {
+      originalValues[input.dataset.fieldKey] = input.value;
+    });
+    
+    // Show/hide save buttons based on changes
+    document.querySelectorAll('.field-input').forEach(input => {
+      input.addEventListener('input', function() {
+        const fieldKey = this.dataset.fieldKey;
+        const saveBtn = document.querySelector(`.btn-save[data-field-key="${fieldKey}"]`);
+        const isChanged = this.value !== originalValues[fieldKey];
+        const isOverride = this.dataset.isOverride === 'true';
+        
+        if (isChanged || isOverride) {
+          saveBtn.style.display = 'inline-block';
+        } else {
+          saveBtn.style.display = 'none';
+        }
+      });
+    });
+    
+    // Save override
+    document.querySelectorAll('.btn-save').forEach(btn => {
+      btn.addEventListener('click', async function() {
+        const fieldKey = this.dataset.fieldKey;
+        const input = document.querySelector(`.field-input[data-field-key="${fieldKey}"]`);
+        const value = input.value.trim();
+        const fieldRow = input.closest('.field-row');
+        
+        // Disable during save
+        fieldRow.classList.add('saving');
+        this.disabled = true;
+        
+        try {
+          const formData = new FormData();
+          formData.append('field_key', fieldKey);
+          formData.append('value', value);
+          
+          const res = await fetch(`${base}/documents/${docId}/overrides`, {
+            method: 'POST',
+            body: formData
+          });
+          
+          if (!res.ok) {
+            const error = await res.json();
+            throw new Error(error.detail || 'Save failed');
+          }
+          
+          // Update UI
+          input.dataset.isOverride = 'true';
+          originalValues[fieldKey] = value;
+          this.style.display = 'none';
+          
+          // Update status badge
+          const statusBadge = fieldRow.querySelector('.status-badge');
+          statusBadge.className = 'status-badge status-override';
+          statusBadge.textContent = 'Override';
+          
+          // Update provenance
+          const provenance = fieldRow.querySelector('.field-provenance');
+          const now = new Date().toISOString().slice(0, 19);
+          provenance.textContent = `Override (updated: ${now})`;
+          
+          // Show clear button
+          const clearBtn = fieldRow.querySelector('.btn-clear');
+          clearBtn.style.display = 'inline-block';
+          
+          // Refresh quality status
+          await refreshQuality();
+          
+          // Show success message
+          showMessage('Override saved successfully', 'success');
+        } catch (e) {
+          showMessage(`Error: ${e.message}`, 'error');
+        } finally {
+          fieldRow.classList.remove('saving');
+          this.disabled = false;
+        }
+      });
+    });
+    
+    // Clear override
+    document.querySelectorAll('.btn-clear').forEach(btn => {
+      btn.addEventListener('click', async function() {
+        const fieldKey = this.dataset.fieldKey;
+        const fieldRow = this.closest('.field-row');
+        
+        if (!confirm(`Clear override for ${fieldKey}?`)) {
+          return;
+        }
+        
+        // Disable during delete
+        fieldRow.classList.add('saving');
+        this.disabled = true;
+        
+        try {
+          const res = await fetch(`${base}/documents/${docId}/overrides/${fieldKey}`, {
+            method: 'DELETE'
+          });
+          
+          if (!res.ok) {
+            const error = await res.json();
+            throw new Error(error.detail || 'Delete failed');
+          }
+          
+          // Reload page to show extracted value
+          window.location.reload();
+        } catch (e) {
+          showMessage(`Error: ${e.message}`, 'error');
+          fieldRow.classList.remove('saving');
+          this.disabled = false;
+        }
+      });
+    });
     
+    async function refreshQuality() {
+      try {
+        const res = await fetch(`${base}/documents/${docId}/quality`);
+        const data = await res.json();
+        const qualityStatus = data.quality.quality_status;
+        
+        // Update quality status badge
+        const statusEl = document.querySelector('.quality-status');
+        statusEl.className = `quality-status ${qualityStatus}`;
+        statusEl.textContent = `Quality Status: ${qualityStatus.toUpperCase().replace('_', ' ')}`;
+        
+        // Update missing fields section if needed
+        const missingFields = data.quality.missing_required_fields || [];
+        if (missingFields.length === 0) {
+          const missingSection = document.querySelector('.missing-fields');
+          if (missingSection) {
+            missingSection.remove();
+          }
+        }
+      } catch (e) {
+        console.error('Failed to refresh quality:', e);
+      }
+    }
+    
+    function showMessage(text, type) {
+      const message = document.createElement('div');
+      message.className = `message ${type}`;
+      message.textContent = text;
+      const header = document.querySelector('.header');
+      header.appendChild(message);
+      setTimeout(() => message.remove(), 3000);
+    }
+  </script>"""
+
+
+@functools.lru_cache(maxsize=4096)
+def base_field_key_for(field_key: str) -> str:
+    """
+    Strip an entity-id prefix from a resolved field key, e.g.
+    "inquiry:1:0.inquiry.date" -> "inquiry.date". Memoized: the mapping is a
+    pure function of the key (the registry is immutable), and the same keys
+    recur on every review render.
+    """
+    if "." in field_key and not field_key.startswith(("doc.", "report.")):
+        # Check if it's an entity-scoped field (entity_id.field_key format)
+        parts = field_key.split(".", 1)
+        if len(parts) == 2:
+            # First part looks like an entity_id (contains colon) and second part is a known field
+            potential_entity_id, potential_field_key = parts
+            if ":" in potential_entity_id and potential_field_key in field_index():
+                return potential_field_key
+    return field_key
+
+
+def stat_mtime_ns(path: str) -> int:
+    """File mtime in nanoseconds, or 0 if the file does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@functools.lru_cache(maxsize=128)
+def render_review_html_cached(doc_id: str, obs_mtime_ns: int, ovr_mtime_ns: int) -> str:
+    # The mtime arguments only key the cache: any write to the observations
+    # or overrides JSON bumps an mtime and forces a fresh render.
+    return render_review_html(doc_id)
+
+
+@functools.lru_cache(maxsize=128)
+def _observations_data_cached(doc_id: str, obs_mtime_ns: int) -> Any:
+    # Same mtime-keyed scheme as the review cache: a rewrite of
+    # observations.json bumps the mtime and forces a fresh disk read.
+    return load_observations(OBSERVATIONS_DIR, doc_id)
+
+
+def load_doc_observations(doc_id: str) -> Tuple[Any, List[Dict[str, Any]]]:
+    """
+    Load a document's stored payload and its observation list, handling both
+    storage formats (legacy bare list, current dict with page_texts).
+    Returns (data, observations); raises 404 when either is missing.
+    The result is shared across requests via the cache — treat it as
+    read-only.
+    """
+    paths = ensure_doc_dirs(OBSERVATIONS_DIR, doc_id)
+    data = _observations_data_cached(doc_id, stat_mtime_ns(paths["observations"]))
+    if not data:
+        raise HTTPException(status_code=404, detail="Document observations not found")
+    observations = data if isinstance(data, list) else data.get("observations", [])
     if not observations:
         raise HTTPException(status_code=404, detail="Document observations not found")
-    
+    return data, observations
+
+
+def require_doc_exists(doc_id: str) -> None:
+    """404 unless the document has stored observations (stat only, no parse)."""
+    if not document_exists(OBSERVATIONS_DIR, doc_id):
+        raise HTTPException(status_code=404, detail="Document observations not found")
+
+
+@functools.lru_cache(maxsize=8)
+def _cases_data_cached(cases_mtime_ns: int) -> Dict[str, List[str]]:
+    # cases.json is one global mapping, so the mtime alone keys the cache;
+    # add_doc_to_case rewrites the file and naturally invalidates it.
+    return load_cases(OBSERVATIONS_DIR)
+
+
+def get_case_doc_ids_cached(case_id: str) -> List[str]:
+    cases_path = os.path.join(OBSERVATIONS_DIR, "cases.json")
+    return _cases_data_cached(stat_mtime_ns(cases_path)).get(case_id, [])
+
+
+@app.get("/documents/{doc_id}/review", response_class=HTMLResponse, include_in_schema=False)
+def review_ui(doc_id: str):
+    """Human review UI for editing document fields and managing overrides."""
+    paths = ensure_doc_dirs(OBSERVATIONS_DIR, doc_id)
+    return HTMLResponse(
+        render_review_html_cached(
+            doc_id,
+            stat_mtime_ns(paths["observations"]),
+            stat_mtime_ns(paths["overrides"]),
+        )
+    )
+
+
+def render_review_html(doc_id: str) -> str:
+    _, observations = load_doc_observations(doc_id)
+
     overrides = load_overrides(OBSERVATIONS_DIR, doc_id)
     resolved_with_overrides = get_resolved_with_overrides(doc_id, observations, overrides)
     
@@ -291,46 +715,24 @@ def review_ui(doc_id: str):
     quality_status = "ok" if not missing_required else "needs_review"
     
     # Group fields by section
-    field_index_dict = {f.field_key: f for f in canonical_fields()}
+    field_index_dict = field_index()
     sections: Dict[str, List[Dict[str, Any]]] = {}
-    for field_key, resolved_entry in resolved_with_overrides.items():
-        # Extract base field_key (remove entity_id prefix if present)
-        # e.g., "inquiry:1:0.inquiry.date" -> "inquiry.date"
-        base_field_key = field_key
-        if "." in field_key and not field_key.startswith("doc.") and not field_key.startswith("report."):
-            # Check if it's an entity-scoped field (entity_id.field_key format)
-            parts = field_key.split(".", 1)
-            if len(parts) == 2:
-                # Check if first part looks like an entity_id (contains colon) and second part is a known field
-                potential_entity_id, potential_field_key = parts
-                if ":" in potential_entity_id and potential_field_key in field_index_dict:
-                    base_field_key = potential_field_key
-        
+    # Iterating in key order means each section accumulates already sorted,
+    # so no per-section sort with a Python-level key callback is needed
+    for field_key, resolved_entry in sorted(resolved_with_overrides.items()):
+        base_field_key = base_field_key_for(field_key)
+
         field_def = field_index_dict.get(base_field_key)
         if not field_def:
             # Skip if we can't find the field definition
             continue
         
         # Skip Document Meta and Page Info sections (not user-editable)
-        if base_field_key.startswith("doc.meta.") or base_field_key.startswith("doc.page."):
+        if base_field_key.startswith(("doc.meta.", "doc.page.")):
             continue
-        
+
         # Determine section from base_field_key prefix
-        section = "Other"
-        if base_field_key.startswith("report."):
-            section = "Report Info"
-        elif base_field_key.startswith("consumer."):
-            section = "Consumer Identity"
-        elif base_field_key.startswith("tradeline."):
-            section = "Tradelines"
-        elif base_field_key.startswith("inquiry."):
-            section = "Inquiries"
-        elif base_field_key.startswith("collection."):
-            section = "Collections"
-        elif base_field_key.startswith("public_record."):
-            section = "Public Records"
-        elif base_field_key.startswith("fraud_alert.") or base_field_key.startswith("consumer_statement."):
-            section = "Alerts & Statements"
+        section = SECTION_BY_PREFIX.get(base_field_key.split(".", 1)[0], "Other")
         
         if section not in sections:
             sections[section] = []
@@ -341,23 +743,21 @@ def review_ui(doc_id: str):
             "resolved_entry": resolved_entry,
         })
     
-    # Sort sections and fields within sections
+    # Section display order
     section_order = [
         "Report Info", "Consumer Identity",
         "Tradelines", "Inquiries", "Collections", "Public Records",
         "Alerts & Statements", "Other"
     ]
-    for section in sections:
-        sections[section].sort(key=lambda x: x["field_key"])
-    
-    # Build HTML
-    sections_html = ""
+    # Build HTML (accumulate rows in lists and join once; += on strings
+    # recopies the accumulated HTML on every row)
+    section_chunks: List[str] = []
     for section_name in section_order:
         if section_name not in sections:
             continue
         fields = sections[section_name]
-        
-        fields_html = ""
+
+        field_rows: List[str] = []
         for field_data in fields:
             field_key = field_data["field_key"]
             field_def = field_data["field_def"]
@@ -371,8 +771,11 @@ def review_ui(doc_id: str):
             is_override = status == "override"
             is_missing = status == "missing"
             
-            # Format value for display
+            # Format value for display (escaped once per field; the previous
+            # '"'-only replace broke on values containing <, > or &)
             display_value = str(value) if value is not None else ""
+            safe_value = html.escape(display_value, quote=True)
+            safe_field_key = html.escape(field_key, quote=True)
             
             # Status badge
             status_class = "status-extracted" if status == "extracted" else ("status-override" if status == "override" else "status-missing")
@@ -402,38 +805,39 @@ def review_ui(doc_id: str):
             # Required indicator
             required_badge = '<span class="required-badge">Required</span>' if is_required else ""
             
-            fields_html += f"""
-            <div class="field-row" data-field-key="{field_key}">
+            field_rows.append(f"""
+            <div class="field-row" data-field-key="{safe_field_key}">
               <div class="field-label">
                 <strong>{field_def.label}</strong>
                 {required_badge}
-                <span class="field-key">{field_key}</span>
+                <span class="field-key">{safe_field_key}</span>
               </div>
               <div class="field-controls">
-                <input 
-                  type="text" 
-                  class="field-input" 
-                  data-field-key="{field_key}"
-                  value="{display_value.replace('"', '&quot;')}"
+                <input
+                  type="text"
+                  class="field-input"
+                  data-field-key="{safe_field_key}"
+                  value="{safe_value}"
                   placeholder="(empty)"
                   {'data-is-override="true"' if is_override else ''}
                 />
                 <span class="status-badge {status_class}">{status_text}</span>
                 <span class="confidence">Confidence: {confidence:.2f}</span>
-                <button class="btn-save" data-field-key="{field_key}" {'style="display:none;"' if not is_override and not display_value else ''}>Save</button>
-                <button class="btn-clear" data-field-key="{field_key}" {'style="display:none;"' if not is_override else ''}>Clear Override</button>
+                <button class="btn-save" data-field-key="{safe_field_key}" {'style="display:none;"' if not is_override and not display_value else ''}>Save</button>
+                <button class="btn-clear" data-field-key="{safe_field_key}" {'style="display:none;"' if not is_override else ''}>Clear Override</button>
               </div>
               <div class="field-provenance">{provenance_text}</div>
             </div>
-            """
-        
-        sections_html += f"""
+            """)
+
+        section_chunks.append(f"""
         <div class="section">
           <h3>{section_name}</h3>
-          {fields_html}
+          {''.join(field_rows)}
         </div>
-        """
-    
+        """)
+    sections_html = "".join(section_chunks)
+
     missing_fields_html = ""
     if missing_required:
         missing_fields_html = f"""
@@ -445,56 +849,16 @@ def review_ui(doc_id: str):
         </div>
         """
     
-    html_content = f"""
-<!doctype html>
+    html_parts = [
+        f"""<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
   <title>Document Review — {doc_id[:8]}...</title>
-  <style>
-    body {{ font-family: system-ui, -apple-system, Segoe UI, Roboto, Arial, sans-serif; margin: 24px; background: #f5f5f5; }}
-    .container {{ max-width: 1200px; margin: 0 auto; }}
-    .header {{ background: white; padding: 20px; border-radius: 10px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-    .header h1 {{ margin: 0 0 10px 0; }}
-    .header .doc-id {{ font-family: monospace; color: #666; }}
-    .quality-status {{ display: inline-block; padding: 6px 12px; border-radius: 6px; font-weight: bold; margin-top: 10px; }}
-    .quality-status.ok {{ background: #15803d; color: white; }}
-    .quality-status.needs_review {{ background: #b45309; color: white; }}
-    .missing-fields {{ background: #fee; border: 2px solid #fcc; padding: 16px; border-radius: 10px; margin-bottom: 20px; }}
-    .missing-fields h3 {{ margin-top: 0; color: #c00; }}
-    .missing-fields ul {{ margin: 10px 0; }}
-    .missing-fields code {{ background: #fcc; padding: 2px 6px; border-radius: 4px; }}
-    .section {{ background: white; padding: 20px; border-radius: 10px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-    .section h3 {{ margin-top: 0; border-bottom: 2px solid #ddd; padding-bottom: 10px; }}
-    .field-row {{ margin: 16px 0; padding: 16px; background: #fafafa; border-radius: 8px; border-left: 4px solid #ddd; }}
-    .field-row:hover {{ background: #f5f5f5; }}
-    .field-label {{ margin-bottom: 8px; }}
-    .field-label strong {{ font-size: 16px; }}
-    .field-key {{ font-family: monospace; font-size: 12px; color: #666; margin-left: 8px; }}
-    .required-badge {{ background: #c00; color: white; padding: 2px 6px; border-radius: 4px; font-size: 11px; margin-left: 8px; }}
-    .field-controls {{ display: flex; gap: 10px; align-items: center; flex-wrap: wrap; margin: 8px 0; }}
-    .field-input {{ flex: 1; min-width: 300px; padding: 8px 12px; border: 2px solid #ddd; border-radius: 6px; font-size: 14px; }}
-    .field-input:focus {{ outline: none; border-color: #0b66c3; }}
-    .status-badge {{ padding: 4px 8px; border-radius: 4px; font-size: 12px; font-weight: bold; }}
-    .status-extracted {{ background: #dbeafe; color: #1e40af; }}
-    .status-override {{ background: #fef3c7; color: #92400e; }}
-    .status-missing {{ background: #fee2e2; color: #991b1b; }}
-    .confidence {{ font-size: 12px; color: #666; }}
-    button {{ padding: 8px 16px; border-radius: 6px; border: none; cursor: pointer; font-size: 14px; font-weight: 500; }}
-    .btn-save {{ background: #15803d; color: white; }}
-    .btn-save:hover {{ background: #16a34a; }}
-    .btn-save:disabled {{ background: #ccc; cursor: not-allowed; }}
-    .btn-clear {{ background: #dc2626; color: white; }}
-    .btn-clear:hover {{ background: #ef4444; }}
-    .field-provenance {{ font-size: 12px; color: #666; margin-top: 8px; font-style: italic; }}
-    .saving {{ opacity: 0.6; pointer-events: none; }}
-    .message {{ padding: 12px; border-radius: 6px; margin: 10px 0; }}
-    .message.success {{ background: #d1fae5; color: #065f46; }}
-    .message.error {{ background: #fee2e2; color: #991b1b; }}
-    a {{ color: #0b66c3; text-decoration: none; }}
-    a:hover {{ text-decoration: underline; }}
-  </style>
+""",
+        REVIEW_STYLE,
+        f"""
 </head>
 <body>
   <div class="container">
@@ -516,164 +880,16 @@ def review_ui(doc_id: str):
     {sections_html}
   </div>
   
-  <script>
-    const base = window.location.origin;
-    const docId = "{doc_id}";
-    
-    // Track original values to detect changes
-    const originalValues = {{}};
-    document.querySelectorAll('.field-input').forEach(input => {{
-      originalValues[input.dataset.fieldKey] = input.value;
-    }});
-    
-    // Show/hide save buttons based on changes
-    document.querySelectorAll('.field-input').forEach(input => {{
-      input.addEventListener('input', function() {{
-        const fieldKey = this.dataset.fieldKey;
-        const saveBtn = document.querySelector(`.btn-save[data-field-key="${{fieldKey}}"]`);
-        const isChanged = this.value !== originalValues[fieldKey];
-        const isOverride = this.dataset.isOverride === 'true';
-        
-        if (isChanged || isOverride) {{
-          saveBtn.style.display = 'inline-block';
-        }} else {{
-          saveBtn.style.display = 'none';
-        }}
-      }});
-    }});
-    
-    // Save override
-    document.querySelectorAll('.btn-save').forEach(btn => {{
-      btn.addEventListener('click', async function() {{
-        const fieldKey = this.dataset.fieldKey;
-        const input = document.querySelector(`.field-input[data-field-key="${{fieldKey}}"]`);
-        const value = input.value.trim();
-        const fieldRow = input.closest('.field-row');
-        
-        // Disable during save
-        fieldRow.classList.add('saving');
-        this.disabled = true;
-        
-        try {{
-          const formData = new FormData();
-          formData.append('field_key', fieldKey);
-          formData.append('value', value);
-          
-          const res = await fetch(`${{base}}/documents/${{docId}}/overrides`, {{
-            method: 'POST',
-            body: formData
-          }});
-          
-          if (!res.ok) {{
-            const error = await res.json();
-            throw new Error(error.detail || 'Save failed');
-          }}
-          
-          // Update UI
-          input.dataset.isOverride = 'true';
-          originalValues[fieldKey] = value;
-          this.style.display = 'none';
-          
-          // Update status badge
-          const statusBadge = fieldRow.querySelector('.status-badge');
-          statusBadge.className = 'status-badge status-override';
-          statusBadge.textContent = 'Override';
-          
-          // Update provenance
-          const provenance = fieldRow.querySelector('.field-provenance');
-          const now = new Date().toISOString().slice(0, 19);
-          provenance.textContent = `Override (updated: ${{now}})`;
-          
-          // Show clear button
-          const clearBtn = fieldRow.querySelector('.btn-clear');
-          clearBtn.style.display = 'inline-block';
-          
-          // Refresh quality status
-          await refreshQuality();
-          
-          // Show success message
-          showMessage('Override saved successfully', 'success');
-        }} catch (e) {{
-          showMessage(`Error: ${{e.message}}`, 'error');
-        }} finally {{
-          fieldRow.classList.remove('saving');
-          this.disabled = false;
-        }}
-      }});
-    }});
-    
-    // Clear override
-    document.querySelectorAll('.btn-clear').forEach(btn => {{
-      btn.addEventListener('click', async function() {{
-        const fieldKey = this.dataset.fieldKey;
-        const fieldRow = this.closest('.field-row');
-        
-        if (!confirm(`Clear override for ${{fieldKey}}?`)) {{
-          return;
-        }}
-        
-        // Disable during delete
-        fieldRow.classList.add('saving');
-        this.disabled = true;
-        
-        try {{
-          const res = await fetch(`${{base}}/documents/${{docId}}/overrides/${{fieldKey}}`, {{
-            method: 'DELETE'
-          }});
-          
-          if (!res.ok) {{
-            const error = await res.json();
-            throw new Error(error.detail || 'Delete failed');
-          }}
-          
-          // Reload page to show extracted value
-          window.location.reload();
-        }} catch (e) {{
-          showMessage(`Error: ${{e.message}}`, 'error');
-          fieldRow.classList.remove('saving');
-          this.disabled = false;
-        }}
-      }});
-    }});
-    
-    async function refreshQuality() {{
-      try {{
-        const res = await fetch(`${{base}}/documents/${{docId}}/quality`);
-        const data = await res.json();
-        const qualityStatus = data.quality.quality_status;
-        
-        // Update quality status badge
-        const statusEl = document.querySelector('.quality-status');
-        statusEl.className = `quality-status ${{qualityStatus}}`;
-        statusEl.textContent = `Quality Status: ${{qualityStatus.toUpperCase().replace('_', ' ')}}`;
-        
-        // Update missing fields section if needed
-        const missingFields = data.quality.missing_required_fields || [];
-        if (missingFields.length === 0) {{
-          const missingSection = document.querySelector('.missing-fields');
-          if (missingSection) {{
-            missingSection.remove();
-          }}
-        }}
-      }} catch (e) {{
-        console.error('Failed to refresh quality:', e);
-      }}
-    }}
-    
-    function showMessage(text, type) {{
-      const message = document.createElement('div');
-      message.className = `message ${{type}}`;
-      message.textContent = text;
-      const header = document.querySelector('.header');
-      header.appendChild(message);
-      setTimeout(() => message.remove(), 3000);
-    }}
-  </script>
+""",
+        REVIEW_SCRIPT_PREFIX,
+        doc_id,
+        REVIEW_SCRIPT_SUFFIX,
+        """
 </body>
-</html>
-    """
+</html>""",
+    ]
     
-    return HTMLResponse(html_content.strip())
+    return "".join(html_parts)
 
 
 def utc_now_iso() -> str:
@@ -684,6 +900,13 @@ def sha256_hex(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
 
+def anchor_hash_hex(b: bytes) -> str:
+    # Anchor hashes are opaque dedup keys, not a published checksum like
+    # doc.meta.sha256, so the cheaper BLAKE2b-128 is used on this per-field
+    # hot path (short inputs are dominated by per-call overhead).
+    return hashlib.blake2b(b, digest_size=16).hexdigest()
+
+
 def anchor_from_page_text(page_text: str, raw_value: str) -> Dict[str, Any]:
     if page_text is None:
         page_text = ""
@@ -694,31 +917,37 @@ def anchor_from_page_text(page_text: str, raw_value: str) -> Dict[str, Any]:
     if idx >= 0 and raw_value:
         before = page_text[max(0, idx - 30): idx]
         after = page_text[idx + len(raw_value): idx + len(raw_value) + 30]
-        snippet = before + raw_value + after
+        # Hash one contiguous slice rather than concatenating the three parts
+        snippet = page_text[max(0, idx - 30): idx + len(raw_value) + 30]
         return {
             "anchor_text_before": before,
             "anchor_text_after": after,
-            "anchor_hash": sha256_hex(snippet.encode("utf-8", errors="ignore")),
+            "anchor_hash": anchor_hash_hex(snippet.encode("utf-8", errors="ignore")),
             "anchor_strength": "strong",
         }
 
     return {
         "anchor_text_before": "",
         "anchor_text_after": "",
-        "anchor_hash": sha256_hex(raw_value.encode("utf-8", errors="ignore")),
+        "anchor_hash": anchor_hash_hex(raw_value.encode("utf-8", errors="ignore")),
         "anchor_strength": "weak" if raw_value else "none",
     }
 
 
+def page_prefix_anchor(page_text: str) -> Dict[str, Any]:
+    """
+    Anchor a whole-page observation on the page's own 50-char prefix.
+    Shared by the ocr_fallback and ocr_escalation paths.
+    """
+    return anchor_from_page_text(page_text, page_text[:50] if page_text else "")
+
+
 def anchor_hit_on_native(text: str) -> bool:
     """
     True iff any of ANCHOR_STRINGS appears in text (case-insensitive).
     Used to detect semantic vs non-semantic native text layer (page 1).
     """
-    if not text:
-        return False
-    t = text.lower()
-    return any(anchor in t for anchor in ANCHOR_STRINGS)
+    return bool(text) and ANCHOR_RE.search(text) is not None
 
 
 def compute_semantic_metrics(text: str) -> Tuple[float, int, bool]:
@@ -732,16 +961,21 @@ def compute_semantic_metrics(text: str) -> Tuple[float, int, bool]:
     if not text:
         return 0.0, 0, False
     
-    # Count ASCII letters (A-Z, a-z)
-    ascii_letter_count = sum(1 for c in text if c.isascii() and c.isalpha())
-    text_len = len(text)
-    alpha_ratio = ascii_letter_count / max(1, text_len)
-    
-    # Count words matching r"[A-Za-z]{3,}"
-    word_pattern = re.compile(r"[A-Za-z]{3,}")
-    words = word_pattern.findall(text)
-    word_count = len(words)
-    
+    # One pass over the letter runs gives both the ASCII letter count and the
+    # word count (runs of >= 3 letters), instead of a pass per metric.
+    if text.isascii():
+        letter_runs = LETTER_RUN_BYTES_RE.finditer(text.encode("ascii"))
+    else:
+        letter_runs = LETTER_RUN_RE.finditer(text)
+    ascii_letter_count = 0
+    word_count = 0
+    for m in letter_runs:
+        run_len = m.end() - m.start()
+        ascii_letter_count += run_len
+        if run_len >= 3:
+            word_count += 1
+    alpha_ratio = ascii_letter_count / max(1, len(text))
+
     contains_anchor = anchor_hit_on_native(text)
     
     return alpha_ratio, word_count, contains_anchor
@@ -762,20 +996,27 @@ def assess_semantic_quality(page_text: str) -> Tuple[bool, float, str, Dict[str,
             "has_common_words": False,
         }
 
-    letter_count = sum(1 for c in page_text if c.isalpha())
-    slash_count = page_text.count("/")
-    space_count = sum(1 for c in page_text if c.isspace())
     total_length = len(page_text)
+    if page_text.isascii():
+        # C-level counting via deletion tables instead of per-character loops
+        b = page_text.encode("ascii")
+        letter_count = len(b.translate(None, ASCII_NON_LETTERS))
+        space_count = total_length - len(b.translate(None, ASCII_WHITESPACE))
+        slash_count = b.count(b"/")
+    else:
+        letter_count = sum(1 for c in page_text if c.isalpha())
+        space_count = sum(1 for c in page_text if c.isspace())
+        slash_count = page_text.count("/")
 
     if total_length == 0:
         semantic_density = 0.0
     else:
         semantic_density = letter_count / total_length
 
-    # Check for common English words
-    common_words = ["the", "and", "of", "to", "in", "a", "is", "it", "you", "that", "he", "was"]
-    page_lower = page_text.lower()
-    has_common_words = any(word in page_lower for word in common_words)
+    # Check for common English words (single pass, no .lower() copy).
+    # Pages at or under 50 chars never fail the no-common-words rule below,
+    # so skip the scan for them and report False.
+    has_common_words = total_length > 50 and COMMON_WORDS_RE.search(page_text) is not None
 
     metrics = {
         "letter_count": letter_count,
@@ -810,9 +1051,10 @@ def extract_native_text_with_fallback(page) -> str:
     text_mode_result = page.get_text('text') or ""
     text_normalized = normalize_text(text_mode_result)
     
-    # Check if 'text' mode has anchors (quick quality check)
-    _, _, has_anchors_text = compute_semantic_metrics(text_normalized)
-    
+    # One metrics pass covers both the anchor check here and the word-count
+    # comparison in the no-anchor branch below
+    _, word_count_text, has_anchors_text = compute_semantic_metrics(text_normalized)
+
     if has_anchors_text:
         # 'text' mode has anchors - use it
         return text_normalized
@@ -821,32 +1063,25 @@ def extract_native_text_with_fallback(page) -> str:
     try:
         blocks = page.get_text('blocks')
         if blocks:
-            # Sort blocks by y coordinate (top to bottom), then x (left to right)
-            # Each block is (x0, y0, x1, y1, "text", block_no, block_type)
-            text_blocks = []
-            for block in blocks:
-                if len(block) >= 5 and isinstance(block[4], str):
-                    text_blocks.append((block[1], block[0], block[4]))  # (y, x, text)
-            
-            # Sort by y (top to bottom), then x (left to right)
-            text_blocks.sort(key=lambda b: (b[0], b[1]))
-            
+            # Each block is (x0, y0, x1, y1, "text", block_no, block_type);
+            # sort the native tuples by y (top to bottom) then x (left to
+            # right) with a C-level key instead of repacking per block
+            text_blocks = [b for b in blocks if len(b) >= 5 and isinstance(b[4], str)]
+            text_blocks.sort(key=itemgetter(1, 0))
+
             # Join block texts
-            blocks_text = "\n".join(block[2] for block in text_blocks)
+            blocks_text = "\n".join(b[4] for b in text_blocks)
             blocks_normalized = normalize_text(blocks_text)
             
             # Check if 'blocks' mode has anchors
-            _, _, has_anchors_blocks = compute_semantic_metrics(blocks_normalized)
-            
+            _, word_count_blocks, has_anchors_blocks = compute_semantic_metrics(blocks_normalized)
+
             if has_anchors_blocks:
                 # 'blocks' mode has anchors - use it
                 return blocks_normalized
             else:
                 # Neither mode has anchors, but 'blocks' might still be better quality
                 # Prefer 'blocks' if it has more words, otherwise use 'text'
-                _, word_count_text, _ = compute_semantic_metrics(text_normalized)
-                _, word_count_blocks, _ = compute_semantic_metrics(blocks_normalized)
-                
                 if word_count_blocks > word_count_text:
                     return blocks_normalized
                 else:
@@ -874,44 +1109,103 @@ def extract_text_via_ocr(pdf_bytes: bytes, page_number: int) -> str:
         )
 
     try:
-        # Open PDF with PyMuPDF (fitz)
+        # Open PDF with PyMuPDF (fitz); always release the document, even if
+        # rendering throws partway.
         doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        if page_number < 1 or page_number > len(doc):
+        try:
+            if page_number < 1 or page_number > len(doc):
+                return ""
+
+            # Load page (0-indexed)
+            page = doc.load_page(page_number - 1)
+
+            # Render to pixmap at OCR_DPI (deterministic: matrix zoom = dpi/72)
+            zoom = OCR_DPI / 72.0
+            matrix = fitz.Matrix(zoom, zoom)
+            # Render without alpha up front (no RGBA->RGB reallocation) and
+            # wrap the samples buffer without a frombytes copy
+            pix = page.get_pixmap(matrix=matrix, alpha=False)
+            img = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples, "raw", "RGB", 0, 1)
+
+            pix = None  # Free memory
+        finally:
             doc.close()
-            return ""
-        
-        # Load page (0-indexed)
-        page = doc.load_page(page_number - 1)
-        
-        # Render to pixmap at 300 DPI (deterministic: matrix zoom = 300/72)
-        zoom = 300.0 / 72.0
-        matrix = fitz.Matrix(zoom, zoom)
-        pix = page.get_pixmap(matrix=matrix)
-        
-        # Convert pixmap to PIL Image
-        # Handle alpha channel: if pixmap has alpha, convert RGBA to RGB
-        if pix.alpha:
-            # Create RGB pixmap from RGBA
-            pix_rgb = fitz.Pixmap(pix, 0)  # 0 = remove alpha channel
-            img = Image.frombytes("RGB", (pix_rgb.width, pix_rgb.height), pix_rgb.samples)
-            pix_rgb = None  # Free memory
-        else:
-            # Already RGB, no alpha channel
-            img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
-        
-        pix = None  # Free memory
-        
-        doc.close()
-        
+
         # Run OCR with pytesseract (will raise if tesseract binary not found)
         try:
-            ocr_text = pytesseract.image_to_string(img, lang="eng", config="--psm 6")
-            return ocr_text or ""
-        except pytesseract.TesseractNotFoundError:
-            raise HTTPException(
-                status_code=422,
-                detail="OCR extraction failed: Tesseract OCR binary not found. Please install tesseract-ocr on your system."
-            )
+            ocr_text = pytesseract.image_to_string(img, lang="eng", config="--psm 6")
+            return ocr_text or ""
+        except pytesseract.TesseractNotFoundError:
+            raise HTTPException(
+                status_code=422,
+                detail="OCR extraction failed: Tesseract OCR binary not found. Please install tesseract-ocr on your system."
+            )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=422,
+            detail=f"OCR extraction failed: {str(e)}"
+        )
+
+
+def ocr_pdf_pages(pdf_path: str, page_numbers: List[int]) -> Dict[int, str]:
+    """
+    OCR multiple pages with rasterization and Tesseract overlapped.
+    The request thread renders pages sequentially (fitz documents are not
+    thread-safe) and feeds images to a thread pool running pytesseract,
+    which spawns one tesseract subprocess per call — so OCR of page N runs
+    while page N+1 rasterizes, and in-flight images are bounded to keep
+    peak memory flat instead of materializing every page bitmap up front.
+    Returns {page_number: raw_ocr_text} for pages that produced text.
+    Raises HTTPException (422) on failure, matching extract_text_via_ocr.
+    """
+    if not OCR_AVAILABLE:
+        raise HTTPException(
+            status_code=422,
+            detail="OCR dependencies not available. Please install PyMuPDF and pytesseract. Also ensure tesseract-ocr binary is installed on the system."
+        )
+    if not page_numbers:
+        return {}
+
+    results: Dict[int, str] = {}
+    max_workers = min(len(page_numbers), OCR_MAX_WORKERS or (os.cpu_count() or 1))
+    max_in_flight = max_workers + 8  # Bound rendered-but-not-OCRed images
+    try:
+        doc = fitz.open(pdf_path)
+        try:
+            zoom = OCR_DPI / 72.0
+            matrix = fitz.Matrix(zoom, zoom)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures: Dict[Any, int] = {}
+                for p in page_numbers:
+                    if p < 1 or p > len(doc):
+                        continue
+                    # Render without alpha up front (no Pixmap reallocation)
+                    # and wrap the samples buffer without a frombytes copy
+                    pix = doc.load_page(p - 1).get_pixmap(matrix=matrix, alpha=False)
+                    img = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples, "raw", "RGB", 0, 1)
+                    fut = executor.submit(
+                        pytesseract.image_to_string, img, lang="eng", config="--psm 6"
+                    )
+                    futures[fut] = p
+                    if len(futures) >= max_in_flight:
+                        done = next(as_completed(futures))
+                        done_page = futures.pop(done)
+                        text = done.result()
+                        if text:
+                            results[done_page] = text
+                for fut in as_completed(futures):
+                    text = fut.result()
+                    if text:
+                        results[futures[fut]] = text
+        finally:
+            doc.close()
+    except pytesseract.TesseractNotFoundError:
+        raise HTTPException(
+            status_code=422,
+            detail="OCR extraction failed: Tesseract OCR binary not found. Please install tesseract-ocr on your system."
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -919,6 +1213,7 @@ def extract_text_via_ocr(pdf_bytes: bytes, page_number: int) -> str:
             status_code=422,
             detail=f"OCR extraction failed: {str(e)}"
         )
+    return results
 
 
 def get_best_page_text(
@@ -983,51 +1278,59 @@ def obs(
 
 
 def resolve_profile(observations: List[Dict[str, Any]]) -> Dict[str, Any]:
-    # Get bureau from observations
+    # One pass both groups observations by key and picks up the bureau
+    # (first report.bureau value wins, as before)
     bureau = None
+    by_key: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
     for o in observations:
-        if o.get("field_key") == "report.bureau" and o.get("raw_value"):
+        if bureau is None and o.get("field_key") == "report.bureau" and o.get("raw_value"):
             bureau = o["raw_value"]
-            break
-    
-    by_key: Dict[str, List[Dict[str, Any]]] = {}
-    for o in observations:
         k = o["field_key"]
         if o.get("entity_id"):
             k = f"{o['entity_id']}.{o['field_key']}"
-        by_key.setdefault(k, []).append(o)
+        by_key[k].append(o)
 
     resolved: Dict[str, Any] = {}
     for k, items in by_key.items():
-        # Apply TransUnion precedence rules if applicable (pass all observations for cross-field checks)
-        items = apply_tu_precedence(k, items, bureau, observations)
-        
-        # Sort by TU priority (if set), then confidence, then created_at
-        # Higher priority/confidence/earlier created_at = sorted first
-        items_sorted = sorted(
-            items,
-            key=lambda x: (
-                float(x.get("_tu_priority", 1)),  # TU priority (2 = highest, 1 = normal, 0 = lowest)
-                float(x.get("confidence", 0.0)),
-                x.get("created_at", ""),
-            ),
-            reverse=True,
-        )
-        # Remove temporary _tu_priority field before returning (cleanup)
-        for item in items_sorted:
-            item.pop("_tu_priority", None)
-        best = items_sorted[0]
-        candidates = []
-        for i in items_sorted[1:]:
-            candidates.append(
-                {
-                    "observation_id": i["obs_id"],
-                    "raw_value": i["raw_value"],
-                    "confidence": i.get("confidence", 0.0),
-                    "method": i.get("method"),
-                    "status": i.get("status"),
-                }
-            )
+        if len(items) == 1:
+            # Fast path: most field keys carry a single observation, so there
+            # is nothing to rank — skip the sort and candidate building.
+            best = items[0]
+            candidates: List[Dict[str, Any]] = []
+        else:
+            # TransUnion precedence priorities, computed per item without
+            # mutating the (possibly cache-shared) observation dicts
+            priorities = apply_tu_precedence(k, items, bureau, observations)
+            # Sort by TU priority (if set), then confidence, then created_at
+            # Higher priority/confidence/earlier created_at = sorted first
+            # (the ranked order also feeds the candidates list below).
+            # Decorate-sort-undecorate: the key tuples are built once in a
+            # comprehension instead of via a lambda call per comparison.
+            decorated = [
+                (
+                    (
+                        float(priorities[j]),  # TU priority (2 = highest, 1 = normal, 0 = lowest)
+                        float(x.get("confidence", 0.0)),
+                        x.get("created_at", ""),
+                    ),
+                    x,
+                )
+                for j, x in enumerate(items)
+            ]
+            decorated.sort(key=itemgetter(0), reverse=True)
+            items_sorted = [d[1] for d in decorated]
+            best = items_sorted[0]
+            candidates = []
+            for i in items_sorted[1:]:
+                candidates.append(
+                    {
+                        "observation_id": i["obs_id"],
+                        "raw_value": i["raw_value"],
+                        "confidence": i.get("confidence", 0.0),
+                        "method": i.get("method"),
+                        "status": i.get("status"),
+                    }
+                )
 
         # Handle missing observations: don't treat them as resolved with empty string
         if best.get("method") == "missing" or best.get("status") == "missing":
@@ -1061,12 +1364,13 @@ def get_resolved_with_overrides(
     resolved = resolve_profile(observations)
     overrides_dict = overrides or {}
     
-    # Build canonical field list for all possible field keys
-    canonical = {f.field_key: f for f in canonical_fields()}
-    
+    # Index observations once; the per-field provenance lookup below was a
+    # linear scan of the whole list for every resolved field
+    obs_by_id = {o.get("obs_id"): o for o in observations}
+
     # Merge overrides into resolved
     result: Dict[str, Dict[str, Any]] = {}
-    
+
     for field_key, resolved_entry in resolved.items():
         # Check if there's an override for this field
         override = overrides_dict.get(field_key)
@@ -1093,12 +1397,8 @@ def get_resolved_with_overrides(
             
             # Get provenance from best observation
             best_obs_id = resolved_entry.get("best_observation_id")
-            best_obs = None
-            for obs in observations:
-                if obs.get("obs_id") == best_obs_id:
-                    best_obs = obs
-                    break
-            
+            best_obs = obs_by_id.get(best_obs_id)
+
             provenance = {
                 "source": "extracted",
                 "page_number": best_obs.get("page_number") if best_obs else None,
@@ -1138,16 +1438,14 @@ def emit_missing_required_identity(
     Never silently omit required identity fields.
     If extraction yields nothing, we still emit missing observations so downstream can audit.
     """
-    required = {
-        "consumer.full_name",
-        "consumer.current_address.line1",
-        "consumer.current_address.city",
-        "consumer.current_address.province",
-        "consumer.current_address.postal_code",
+    # Only track the handful of required keys instead of materializing a set
+    # of every extracted field key on the document
+    present = {
+        o["field_key"]
+        for o in observations
+        if o["field_key"] in REQUIRED_IDENTITY_FIELD_KEYS and o.get("status") == "extracted"
     }
-
-    present = {o["field_key"] for o in observations if o.get("status") == "extracted"}
-    missing = sorted(list(required - present))
+    missing = sorted(REQUIRED_IDENTITY_FIELD_KEYS - present)
 
     for k in missing:
         observations.append(
@@ -1172,7 +1470,7 @@ def emit_missing_required_identity(
 
 
 def normalize_whitespace(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    return WHITESPACE_RUN_RE.sub(" ", (s or "").strip())
 
 
 def normalize_text(text: str) -> str:
@@ -1188,32 +1486,26 @@ def normalize_text(text: str) -> str:
     """
     if not text:
         return ""
-    
-    result = []
-    for char in text:
-        # Allow printable characters and common whitespace
-        if char.isprintable() or char in "\n\r\t":
-            # Check if it's a control character (Cc) or format character (Cf)
-            category = unicodedata.category(char)
-            if category in ("Cc", "Cf"):
-                # Replace control/format chars with space, but preserve newlines/tabs/carriage returns
-                if char in "\n\r\t":
-                    result.append(char)
-                else:
-                    result.append(" ")
-            else:
+
+    if text.isascii():
+        # Fast path: one C-level translate replaces the per-character loop.
+        # (str.isprintable already excludes Cc/Cf, so "printable or in
+        # '\n\r\t', with other Cc/Cf as space" reduces to this table.)
+        normalized = text.translate(ASCII_NORMALIZE_TABLE)
+    else:
+        result = []
+        for char in text:
+            # Allow printable characters and common whitespace; everything
+            # else (including Cc/Cf control/format chars) becomes a space
+            if char.isprintable() or char in "\n\r\t":
                 result.append(char)
-        else:
-            # Non-printable and not in whitelist -> replace with space
-            result.append(" ")
-    
-    # Collapse repeated whitespace (but preserve newlines)
-    normalized = "".join(result)
-    # Replace multiple spaces with single space, but keep newlines
-    normalized = re.sub(r"[ \t]+", " ", normalized)  # Collapse spaces and tabs
-    normalized = re.sub(r" +\n", "\n", normalized)  # Remove trailing spaces before newlines
-    normalized = re.sub(r"\n +", "\n", normalized)  # Remove leading spaces after newlines
-    normalized = re.sub(r"\n{3,}", "\n\n", normalized)  # Collapse multiple newlines to max 2
+            else:
+                result.append(" ")
+        normalized = "".join(result)
+
+    # Collapse repeated whitespace in one pass: spaces/tabs to a single
+    # space, spaces trimmed around newlines, newline runs capped at 2
+    normalized = WS_FUSED_RE.sub(_ws_fused_replace, normalized)
     
     return normalized.strip()
 
@@ -1239,134 +1531,118 @@ def extract_inquiries_from_pages(
     for page_idx, page_text in enumerate(page_texts):
         page_number = page_idx + 1
 
-        # Must have "Inquiries" somewhere on the page
-        if not re.search(r"\bInquiries\b", page_text, re.IGNORECASE):
+        # Must have "Inquiries" somewhere on the page. Literal `in` probes
+        # run in C (memmem) and reject the common no-inquiry pages far
+        # cheaper than the regex engine; the word-boundary regex only runs
+        # once a literal hits.
+        if (
+            "Inquiries" not in page_text
+            and "inquiries" not in page_text
+            and "INQUIRIES" not in page_text
+        ):
             continue
-
-        lines = page_text.splitlines()
-
-        # Locate the Inquiries header line
-        start_idx = None
-        for i, line in enumerate(lines):
-            if re.search(r"\bInquiries\b", line, re.IGNORECASE):
-                start_idx = i
-                break
-        if start_idx is None:
+        header_m = INQUIRY_HEADER_RE.search(page_text)
+        if header_m is None:
             continue
 
-        # Stop scanning when we hit another likely section header
-        stop_header = re.compile(
-            r"^\s*(Tradelines|Accounts|Collections|Public Records|Personal Information|Summary)\b",
-            re.IGNORECASE
-        )
-
-        # Date patterns (flexible; keep simple & deterministic)
-        date_patterns = [
-            re.compile(r"\b(\d{4}-\d{2}-\d{2})\b"),          # YYYY-MM-DD
-            re.compile(r"\b(\d{1,2}/\d{1,2}/\d{2,4})\b"),   # M/D/YY(YY)
-            re.compile(r"\b(\d{1,2}-\d{1,2}-\d{2,4})\b"),   # M-D-YY(YY)
-        ]
-
-        def find_anchor_pos(needle: str) -> int:
-            if not needle:
-                return -1
-            return page_text.find(needle)
+        # Section spans from the line after the header to the next section
+        # header (or end of page). Working with character offsets lets one
+        # finditer over the span replace the old line-by-line date scan.
+        section_start = page_text.find("\n", header_m.end())
+        if section_start < 0:
+            continue
+        section_start += 1
+        stop_m = INQUIRY_STOP_HEADER_LINE_RE.search(page_text, section_start)
+        section_end = stop_m.start() if stop_m else len(page_text)
 
+        text_len = len(page_text)
         block_index = 0
-        i = start_idx + 1
-        while i < len(lines):
-            line = lines[i].strip()
-            if stop_header.search(line):
-                break
-            if not line:
-                i += 1
+        prev_line_start = -1
+        for m in INQUIRY_DATE_RE.finditer(page_text, section_start, section_end):
+            matched_date = m.group(1)
+
+            # Recover the containing line from the match offset; only the
+            # first date on a line starts a block, as before
+            line_start = page_text.rfind("\n", section_start, m.start()) + 1
+            if line_start == 0:
+                line_start = section_start
+            if line_start == prev_line_start:
                 continue
+            prev_line_start = line_start
 
-            # Date detection
-            matched_date = None
-            for pat in date_patterns:
-                m = pat.search(line)
-                if m:
-                    matched_date = m.group(1)
-                    break
+            entity_id = f"inquiry:{page_number}:{block_index}"
+            anchor_dict = anchor_from_page_text(page_text, matched_date)
 
-            if matched_date:
-                entity_id = f"inquiry:{page_number}:{block_index}"
+            observations.append(
+                obs(
+                    doc_id=doc_id,
+                    ingestion_run_id=ingestion_run_id,
+                    field_key="inquiry.date",
+                    raw_value=matched_date,
+                    page_number=page_number,
+                    method="pattern_match",
+                    confidence=0.7,
+                    status="extracted",
+                    entity_id=entity_id,
+                    anchor=anchor_dict,
+                )
+            )
+
+            # Try to capture subscriber name near the date (same line or next 3 lines)
+            subscriber = None
+            cand_start = line_start
+            for _ in range(4):
+                if cand_start >= text_len:
+                    break
+                cand_end = page_text.find("\n", cand_start)
+                if cand_end < 0:
+                    cand_end = text_len
+                cand = page_text[cand_start:cand_end].strip()
+                cand_start = cand_end + 1
+                if INQUIRY_STOP_HEADER_RE.search(cand):
+                    break
+                if not cand:
+                    continue
+
+                # Heuristic: remove date token, then use the remainder if it looks like a name/org
+                cand_clean = INQUIRY_DATE_YMD_RE.sub("", cand).strip()
+                cand_clean = INQUIRY_DATE_MDY_RE.sub("", cand_clean).strip()
+                if not cand_clean:
+                    continue
+
+                # Prefer explicit labels when present
+                if SUBSCRIBER_LABEL_RE.search(cand):
+                    # Extract text after the label
+                    lm = SUBSCRIBER_LABEL_VALUE_RE.search(cand)
+                    if lm:
+                        subscriber = normalize_whitespace(lm.group(2))[:120]
+                    else:
+                        subscriber = cand_clean[:120]
+                    break
 
-                # anchor around the line where date was found
-                pos = find_anchor_pos(line)
-                if pos < 0:
-                    pos = max(0, find_anchor_pos(matched_date))
-                anchor_snippet = page_text[max(0, pos):min(len(page_text), pos + len(line) + 60)]
-                anchor_dict = anchor_from_page_text(page_text, matched_date)
+                # Otherwise accept a plausible org-like string
+                if len(cand_clean) >= 4 and LETTER_RUN_RE.search(cand_clean):
+                    subscriber = cand_clean[:120]
+                    break
 
+            if subscriber:
+                s_anchor = anchor_from_page_text(page_text, subscriber)
                 observations.append(
                     obs(
                         doc_id=doc_id,
                         ingestion_run_id=ingestion_run_id,
-                        field_key="inquiry.date",
-                        raw_value=matched_date,
+                        field_key="inquiry.subscriber_name",
+                        raw_value=subscriber,
                         page_number=page_number,
                         method="pattern_match",
                         confidence=0.7,
                         status="extracted",
                         entity_id=entity_id,
-                        anchor=anchor_dict,
+                        anchor=s_anchor,
                     )
                 )
 
-                # Try to capture subscriber name near the date (same line or next 3 lines)
-                subscriber = None
-                for j in range(0, 4):
-                    if i + j >= len(lines):
-                        break
-                    cand = lines[i + j].strip()
-                    if stop_header.search(cand):
-                        break
-                    if not cand:
-                        continue
-
-                    # Heuristic: remove date token, then use the remainder if it looks like a name/org
-                    cand_clean = re.sub(r"\b\d{4}-\d{2}-\d{2}\b", "", cand).strip()
-                    cand_clean = re.sub(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b", "", cand_clean).strip()
-                    if not cand_clean:
-                        continue
-
-                    # Prefer explicit labels when present
-                    if re.search(r"\b(Subscriber|Member|Company|Creditor)\b", cand, re.IGNORECASE):
-                        # Extract text after the label
-                        m = re.search(r"\b(Subscriber|Member|Company|Creditor)\s*[:\-]?\s*(.+)", cand, re.IGNORECASE)
-                        if m:
-                            subscriber = normalize_whitespace(m.group(2))[:120]
-                        else:
-                            subscriber = cand_clean[:120]
-                        break
-
-                    # Otherwise accept a plausible org-like string
-                    if len(cand_clean) >= 4 and re.search(r"[A-Za-z]", cand_clean):
-                        subscriber = cand_clean[:120]
-                        break
-
-                if subscriber:
-                    s_anchor = anchor_from_page_text(page_text, subscriber)
-                    observations.append(
-                        obs(
-                            doc_id=doc_id,
-                            ingestion_run_id=ingestion_run_id,
-                            field_key="inquiry.subscriber_name",
-                            raw_value=subscriber,
-                            page_number=page_number,
-                            method="pattern_match",
-                            confidence=0.7,
-                            status="extracted",
-                            entity_id=entity_id,
-                            anchor=s_anchor,
-                        )
-                    )
-
-                block_index += 1
-
-            i += 1
+            block_index += 1
 
     return observations
 
@@ -1417,13 +1693,33 @@ async def upload_pdf(file: UploadFile = File(...), case_id: Optional[str] = Form
     if not file.filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
 
+    # Ingestion is CPU-bound (fitz parsing, regex scans, OCR); run it in the
+    # thread pool so the event loop stays free and uploads overlap. The
+    # spooled upload file is handed over as-is and streamed to disk there.
+    return await run_in_threadpool(ingest_pdf_upload, file.file, file.filename, case_id)
+
+
+def ingest_pdf_upload(src, filename: str, case_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Synchronous ingestion pipeline for an uploaded PDF: store the file,
+    extract text (native or OCR fallback), build observations, and persist.
+    src is a readable binary file object (the upload's spooled file).
+    Returns the upload response payload.
+    """
     doc_id = str(uuid.uuid4())
     stored_filename = f"{doc_id}.pdf"
     stored_path = os.path.join(UPLOAD_DIR, stored_filename)
 
-    content = await file.read()
+    # Stream to disk in chunks with the SHA-256 folded into the same pass,
+    # so the whole upload is never held in memory
+    hasher = hashlib.sha256()
+    byte_size = 0
     with open(stored_path, "wb") as f:
-        f.write(content)
+        while chunk := src.read(1 << 20):
+            f.write(chunk)
+            hasher.update(chunk)
+            byte_size += len(chunk)
+    sha256_digest = hasher.hexdigest()
 
     ingestion_run_id = str(uuid.uuid4())
     created_at = utc_now_iso()
@@ -1435,40 +1731,45 @@ async def upload_pdf(file: UploadFile = File(...), case_id: Optional[str] = Form
             detail="PyMuPDF (fitz) is required for PDF text extraction. Please install PyMuPDF."
         )
     
-    doc = fitz.open(stream=content, filetype="pdf")
-    page_count = len(doc)
-    
-    # 1) Anchor hit on NATIVE text (page 1 only): get_text('text') — no blocks fallback
-    page0 = doc.load_page(0)
-    native_page1_raw = page0.get_text("text") or ""
-    native_page1 = normalize_text(native_page1_raw)
-    anchor_hit = anchor_hit_on_native(native_page1)
-    
-    # 2) If anchor_hit == false: treat as non-semantic. OCR enabled -> fallback; OCR disabled -> 422
-    ocr_enabled, force_ocr = is_ocr_enabled()
-    if not anchor_hit and not ocr_enabled:
+    # Close the fitz document promptly (and on every exit path) so the parsed
+    # object tree does not stay resident for the remainder of ingestion.
+    doc = fitz.open(stored_path)
+    try:
+        page_count = len(doc)
+
+        # 1) Anchor hit on NATIVE text (page 1 only): get_text('text') — no blocks fallback
+        page0 = doc.load_page(0)
+        native_page1_raw = page0.get_text("text") or ""
+        native_page1 = normalize_text(native_page1_raw)
+        anchor_hit = anchor_hit_on_native(native_page1)
+
+        # 2) If anchor_hit == false: treat as non-semantic. OCR enabled -> fallback; OCR disabled -> 422
+        ocr_enabled, force_ocr = is_ocr_enabled()
+        if not anchor_hit and not ocr_enabled:
+            raise HTTPException(
+                status_code=422,
+                detail="Text layer is non-semantic and OCR is disabled",
+            )
+
+        if anchor_hit:
+            ingestion_path = "native_text"
+            logger.info(f"doc_id={doc_id}: native_text path (anchor_hit=true on page 1 native)")
+        else:
+            ingestion_path = "ocr_fallback"
+            logger.info(f"doc_id={doc_id}: ocr_fallback path (anchor_hit=false on page 1 native, ocr_enabled=true)")
+
+        # Extract native text from all pages: get_text('text') only, then
+        # normalize. Page 1 was already extracted and normalized for the
+        # anchor probe above, so reuse it instead of a second pass.
+        page_texts_canonical_native: List[str] = [native_page1]
+        page_texts_raw_native: List[str] = [native_page1_raw]
+        for page_num in range(1, page_count):
+            page = doc.load_page(page_num)
+            raw_text = page.get_text("text") or ""
+            page_texts_raw_native.append(raw_text)
+            page_texts_canonical_native.append(normalize_text(raw_text))
+    finally:
         doc.close()
-        raise HTTPException(
-            status_code=422,
-            detail="Text layer is non-semantic and OCR is disabled",
-        )
-    
-    if anchor_hit:
-        ingestion_path = "native_text"
-        logger.info(f"doc_id={doc_id}: native_text path (anchor_hit=true on page 1 native)")
-    else:
-        ingestion_path = "ocr_fallback"
-        logger.info(f"doc_id={doc_id}: ocr_fallback path (anchor_hit=false on page 1 native, ocr_enabled=true)")
-    
-    # Extract native text from all pages: get_text('text') only, then normalize
-    page_texts_canonical_native: List[str] = []
-    page_texts_raw_native: List[str] = []
-    for page_num in range(page_count):
-        page = doc.load_page(page_num)
-        raw_text = page.get_text("text") or ""
-        page_texts_raw_native.append(raw_text)
-        page_texts_canonical_native.append(normalize_text(raw_text))
-    doc.close()
     
     page_texts_normalized_native = page_texts_canonical_native
     page_texts = page_texts_normalized_native
@@ -1479,16 +1780,16 @@ async def upload_pdf(file: UploadFile = File(...), case_id: Optional[str] = Form
 
     # Document meta (derived)
     observations.append(
-        obs(doc_id=doc_id, ingestion_run_id=ingestion_run_id, field_key="doc.meta.original_filename", raw_value=file.filename, method="derived", confidence=1.0)
+        obs(doc_id=doc_id, ingestion_run_id=ingestion_run_id, field_key="doc.meta.original_filename", raw_value=filename, method="derived", confidence=1.0)
     )
     observations.append(
         obs(doc_id=doc_id, ingestion_run_id=ingestion_run_id, field_key="doc.meta.stored_filename", raw_value=stored_filename, method="derived", confidence=1.0)
     )
     observations.append(
-        obs(doc_id=doc_id, ingestion_run_id=ingestion_run_id, field_key="doc.meta.sha256", raw_value=sha256_hex(content), method="derived", confidence=1.0)
+        obs(doc_id=doc_id, ingestion_run_id=ingestion_run_id, field_key="doc.meta.sha256", raw_value=sha256_digest, method="derived", confidence=1.0)
     )
     observations.append(
-        obs(doc_id=doc_id, ingestion_run_id=ingestion_run_id, field_key="doc.meta.byte_size", raw_value=len(content), method="derived", confidence=1.0)
+        obs(doc_id=doc_id, ingestion_run_id=ingestion_run_id, field_key="doc.meta.byte_size", raw_value=byte_size, method="derived", confidence=1.0)
     )
     observations.append(
         obs(doc_id=doc_id, ingestion_run_id=ingestion_run_id, field_key="doc.meta.page_count", raw_value=page_count, method="derived", confidence=1.0)
@@ -1502,7 +1803,9 @@ async def upload_pdf(file: UploadFile = File(...), case_id: Optional[str] = Form
     page_quality_metrics: Dict[int, Dict[str, Any]] = {}
     page_texts_ocr: Dict[int, str] = {}  # Normalized OCR text
     page_texts_ocr_raw: Dict[int, str] = {}  # Raw OCR text
-    ocr_triggered_pages: List[int] = []
+    # Set: membership is probed per page below (escalation trigger and
+    # source labeling); sorted only where notes need a stable order
+    ocr_triggered_pages: Set[int] = set()
 
     # Process pages based on ingestion path
     for i, t in enumerate(page_texts_normalized_native, start=1):
@@ -1555,70 +1858,78 @@ async def upload_pdf(file: UploadFile = File(...), case_id: Optional[str] = Form
             )
         )
 
-        # OCR processing: only if we're in ocr_fallback path
-        if ingestion_path == "ocr_fallback":
-            # For ocr_fallback path, run OCR on all pages (text is non-semantic at document level)
-            try:
-                ocr_text = extract_text_via_ocr(content, i)
-                if ocr_text:
-                    # Store raw OCR text, normalize separately
-                    page_texts_ocr_raw[i] = ocr_text
-                    page_texts_ocr[i] = normalize_text(ocr_text)  # Normalized OCR text
-                    ocr_triggered_pages.append(i)
-
-                    # Store OCR text observation (store normalized text)
-                    ocr_normalized = page_texts_ocr[i]
-                    observations.append(
-                        obs(
-                            doc_id=doc_id,
-                            ingestion_run_id=ingestion_run_id,
-                            field_key="doc.page.text_ocr",
-                            entity_id=f"page:{i}",
-                            page_number=i,
-                            raw_value=ocr_normalized,  # Store normalized OCR text
-                            method="ocr",
-                            confidence=0.85,
-                            reason="OCR invoked (ocr_fallback path, anchor_hit=false on page 1 native)",
-                            anchor=anchor_from_page_text(ocr_normalized, ocr_normalized[:50] if ocr_normalized else ""),
-                        )
-                    )
-            except HTTPException:
-                # OCR failed - re-raise to surface the error
-                raise
+    # OCR processing: only if we're in ocr_fallback path
+    if ingestion_path == "ocr_fallback":
+        # Decide per page, not per document: a page whose native text already
+        # assesses as semantic keeps it; only pages failing the per-page
+        # quality check are rasterized and OCRed (in parallel; failures
+        # surface as 422).
+        pages_needing_ocr = [
+            i for i in range(1, page_count + 1) if page_semantic_quality.get(i, True)
+        ]
+        ocr_results = ocr_pdf_pages(stored_path, pages_needing_ocr)
+        for i in sorted(ocr_results):
+            ocr_text = ocr_results[i]
+            # Store raw OCR text, normalize separately
+            page_texts_ocr_raw[i] = ocr_text
+            page_texts_ocr[i] = normalize_text(ocr_text)  # Normalized OCR text
+            ocr_triggered_pages.add(i)
+
+            # Store OCR text observation (store normalized text)
+            ocr_normalized = page_texts_ocr[i]
+            observations.append(
+                obs(
+                    doc_id=doc_id,
+                    ingestion_run_id=ingestion_run_id,
+                    field_key="doc.page.text_ocr",
+                    entity_id=f"page:{i}",
+                    page_number=i,
+                    raw_value=ocr_normalized,  # Store normalized OCR text
+                    method="ocr",
+                    confidence=0.85,
+                    reason="OCR invoked (ocr_fallback path, anchor_hit=false on page 1 native)",
+                    anchor=page_prefix_anchor(ocr_normalized),
+                )
+            )
 
     # Build combined normalized page_texts (canonical: OCR when available, native when semantic)
     # When OCR fallback runs, OCR text becomes canonical for all downstream processing
     page_texts_normalized: List[str] = []
     page_texts_raw: List[str] = []  # Canonical raw (OCR raw when OCR used, native raw when native used)
     page_texts_native_raw: List[str] = []  # Native raw text (stored separately, not exposed as primary)
+    # Per-page source logging is only worth formatting when DEBUG is on
+    log_sources = logger.isEnabledFor(logging.DEBUG)
     for i in range(1, len(page_texts_normalized_native) + 1):
-        # Use normalized versions for combined text (canonical: OCR when available)
-        # get_best_page_text prefers OCR text when available (from ocr_fallback path)
-        best_normalized = get_best_page_text(i, page_texts_normalized_native, page_texts_ocr, page_semantic_quality)
-        page_texts_normalized.append(best_normalized)
-        
-        # Log which text source is being used for canonical text
+        # Canonical text: OCR when available (OCR only runs when native text
+        # was insufficient), otherwise native — inlined from get_best_page_text
         if i in page_texts_ocr:
-            logger.debug(f"doc_id={doc_id}: page {i} using OCR text as canonical (len={len(best_normalized)})")
+            best_normalized = page_texts_ocr[i]
         else:
-            logger.debug(f"doc_id={doc_id}: page {i} using native text as canonical (len={len(best_normalized)})")
-        
+            best_normalized = page_texts_normalized_native[i - 1]
+        page_texts_normalized.append(best_normalized)
+
+        if log_sources:
+            source = "OCR" if i in page_texts_ocr else "native"
+            logger.debug(f"doc_id={doc_id}: page {i} using {source} text as canonical (len={len(best_normalized)})")
+
         # Get corresponding raw text (canonical: OCR raw when OCR used, native raw when native used)
         if i in page_texts_ocr_raw:
             best_raw = page_texts_ocr_raw[i]
         else:
             best_raw = page_texts_raw_native[i - 1]
         page_texts_raw.append(best_raw)
-        
+
         # Always store native raw separately
         page_texts_native_raw.append(page_texts_raw_native[i - 1])
 
-    # Canonical total text length and per-page text length (use canonical text, not native when OCR ran)
-    total_text_normalized = "\n".join(page_texts_normalized)
-    total_text_len = len(total_text_normalized)
-    observations.append(
-        obs(doc_id=doc_id, ingestion_run_id=ingestion_run_id, field_key="doc.meta.text_length", raw_value=total_text_len, method="text", confidence=1.0)
-    )
+    # Canonical total text length and per-page text length (use canonical text, not native when OCR ran).
+    # Only the length is needed here, so sum page lengths (+1 per "\n"
+    # separator) instead of materializing the joined document.
+    total_text_len = sum(len(t) for t in page_texts_normalized) + max(0, len(page_texts_normalized) - 1)
+    # Keep a direct reference: the escalation path below corrects this value
+    # in place instead of re-scanning the observation list for it
+    text_length_obs = obs(doc_id=doc_id, ingestion_run_id=ingestion_run_id, field_key="doc.meta.text_length", raw_value=total_text_len, method="text", confidence=1.0)
+    observations.append(text_length_obs)
     
     # Track low-text pages for OCR escalation
     low_text_pages_for_ocr: List[int] = []
@@ -1642,70 +1953,77 @@ async def upload_pdf(file: UploadFile = File(...), case_id: Optional[str] = Form
         if text_len < LOW_TEXT_THRESHOLD and i not in ocr_triggered_pages:
             low_text_pages_for_ocr.append(i)
     
-    # OCR escalation: re-extract low-text pages with OCR
+    # OCR escalation: re-extract low-text pages with OCR in one parallel batch
+    # (ocr_pdf_pages fans the page images out to worker threads) instead of a
+    # sequential page-at-a-time loop
     ocr_escalation_pages: List[int] = []
     if low_text_pages_for_ocr and OCR_AVAILABLE:
-        for page_num in low_text_pages_for_ocr:
-            try:
-                ocr_text = extract_text_via_ocr(content, page_num)
-                if ocr_text:
-                    ocr_normalized = normalize_text(ocr_text)
-                    # Update page texts with OCR result
-                    page_texts_ocr_raw[page_num] = ocr_text
-                    page_texts_ocr[page_num] = ocr_normalized
-                    page_texts_normalized[page_num - 1] = ocr_normalized  # Update normalized (0-indexed)
-                    page_texts_raw[page_num - 1] = ocr_text  # Update raw (0-indexed)
-                    ocr_triggered_pages.append(page_num)
-                    ocr_escalation_pages.append(page_num)
-                    
-                    # Update page text_length observation
-                    new_text_len = len(ocr_normalized)
-                    # Find and update the observation
-                    for obs_item in observations:
-                        if (obs_item.get("field_key") == "doc.page.text_length" and 
-                            obs_item.get("page_number") == page_num and
-                            obs_item.get("entity_id") == f"page:{page_num}"):
-                            obs_item["raw_value"] = new_text_len
-                            obs_item["method"] = "ocr_escalation"
-                            obs_item["confidence"] = 0.85
-                            break
-                    
-                    # Store OCR text observation
-                    observations.append(
-                        obs(
-                            doc_id=doc_id,
-                            ingestion_run_id=ingestion_run_id,
-                            field_key="doc.page.text_ocr",
-                            entity_id=f"page:{page_num}",
-                            page_number=page_num,
-                            raw_value=ocr_normalized,
-                            method="ocr_escalation",
-                            confidence=0.85,
-                            reason=f"OCR escalation triggered (text_length={text_len} < {LOW_TEXT_THRESHOLD})",
-                            anchor=anchor_from_page_text(ocr_normalized, ocr_normalized[:50] if ocr_normalized else ""),
-                        )
-                    )
-            except HTTPException:
-                # OCR failed for this page - log but continue
-                logger.warning(f"doc_id={doc_id}: OCR escalation failed for page {page_num}")
-            except Exception as e:
-                logger.warning(f"doc_id={doc_id}: OCR escalation error for page {page_num}: {e}")
-    
+        escalation_results: Dict[int, str] = {}
+        try:
+            escalation_results = ocr_pdf_pages(stored_path, low_text_pages_for_ocr)
+        except HTTPException:
+            # OCR failed - log but continue with the native text
+            logger.warning(f"doc_id={doc_id}: OCR escalation failed for pages {low_text_pages_for_ocr}")
+        except Exception as e:
+            logger.warning(f"doc_id={doc_id}: OCR escalation error: {e}")
+        for page_num in sorted(escalation_results):
+            ocr_text = escalation_results[page_num]
+            if not ocr_text:
+                continue
+            old_text_len = len(page_texts_normalized[page_num - 1])
+            ocr_normalized = normalize_text(ocr_text)
+            # Update page texts with OCR result
+            page_texts_ocr_raw[page_num] = ocr_text
+            page_texts_ocr[page_num] = ocr_normalized
+            page_texts_normalized[page_num - 1] = ocr_normalized  # Update normalized (0-indexed)
+            page_texts_raw[page_num - 1] = ocr_text  # Update raw (0-indexed)
+            ocr_triggered_pages.add(page_num)
+            ocr_escalation_pages.append(page_num)
+
+            # Update page text_length observation
+            new_text_len = len(ocr_normalized)
+            # Find and update the observation
+            for obs_item in observations:
+                if (obs_item.get("field_key") == "doc.page.text_length" and
+                    obs_item.get("page_number") == page_num and
+                    obs_item.get("entity_id") == f"page:{page_num}"):
+                    obs_item["raw_value"] = new_text_len
+                    obs_item["method"] = "ocr_escalation"
+                    obs_item["confidence"] = 0.85
+                    break
+
+            # Store OCR text observation
+            observations.append(
+                obs(
+                    doc_id=doc_id,
+                    ingestion_run_id=ingestion_run_id,
+                    field_key="doc.page.text_ocr",
+                    entity_id=f"page:{page_num}",
+                    page_number=page_num,
+                    raw_value=ocr_normalized,
+                    method="ocr_escalation",
+                    confidence=0.85,
+                    reason=f"OCR escalation triggered (text_length={old_text_len} < {LOW_TEXT_THRESHOLD})",
+                    anchor=page_prefix_anchor(ocr_normalized),
+                )
+            )
+
     # Note: Identity extraction will happen later and will use the updated page_texts_normalized
     # from OCR escalation, so we don't need to re-run it here
 
-    # Doc-level OCR audit observations
+    # Doc-level OCR audit observations (reference kept for the in-place
+    # escalation correction below)
+    ocr_pages_count_obs: Optional[Dict[str, Any]] = None
     if ocr_triggered_pages:
-        observations.append(
-            obs(
-                doc_id=doc_id,
-                ingestion_run_id=ingestion_run_id,
-                field_key="doc.meta.ocr_pages_count",
-                raw_value=len(ocr_triggered_pages),
-                method="derived",
-                confidence=1.0,
-            )
+        ocr_pages_count_obs = obs(
+            doc_id=doc_id,
+            ingestion_run_id=ingestion_run_id,
+            field_key="doc.meta.ocr_pages_count",
+            raw_value=len(ocr_triggered_pages),
+            method="derived",
+            confidence=1.0,
         )
+        observations.append(ocr_pages_count_obs)
         
         total_ocr_length = sum(len(page_texts_ocr[p]) for p in ocr_triggered_pages)
         observations.append(
@@ -1721,23 +2039,37 @@ async def upload_pdf(file: UploadFile = File(...), case_id: Optional[str] = Form
 
     # Bureau detection (deterministic) - use canonical text (OCR when ocr_fallback, else native)
     bureau = "Unknown"
-    normalized_lower = total_text_normalized.lower()
-    
-    # Robust TransUnion detection with exact keywords
-    transunion_keywords = [
-        "transunion",
-        "credit report",
-        "accounts summary",
-        "personal information"
-    ]
-    if any(keyword in normalized_lower for keyword in transunion_keywords):
+
+    # Join lazily, only for the scans below. Deferring the join past the
+    # escalation loop also means these probes see post-escalation OCR text.
+    total_text_normalized = "\n".join(page_texts_normalized)
+
+    # Robust TransUnion detection with exact keywords. IGNORECASE on the
+    # compiled patterns avoids lowercasing the whole document just for this
+    # probe, and the TU alternation keeps its precedence over Equifax.
+    if TRANSUNION_KEYWORDS_RE.search(total_text_normalized):
         bureau = "TransUnion"
-    elif "equifax" in normalized_lower:
+    elif EQUIFAX_KEYWORD_RE.search(total_text_normalized):
         bureau = "Equifax"
     
-    # Calculate text quality metrics
-    normalized_len = total_text_len
-    printable_count = sum(1 for c in total_text_normalized if c.isprintable() or c in "\n\r\t")
+    # Calculate text quality metrics (against the same joined text the
+    # scans above saw, so the ratio denominator matches)
+    normalized_len = len(total_text_normalized)
+    if total_text_normalized.isascii():
+        # C-level count via a deletion table (same trick as
+        # assess_semantic_quality): survivors are printable or \n\r\t
+        printable_count = len(
+            total_text_normalized.encode("ascii").translate(None, ASCII_UNPRINTABLE)
+        )
+    else:
+        # map(str.isprintable, ...) keeps the per-char loop in C; \n\r\t are
+        # not "printable" so they are counted separately.
+        printable_count = (
+            sum(map(str.isprintable, total_text_normalized))
+            + total_text_normalized.count("\n")
+            + total_text_normalized.count("\r")
+            + total_text_normalized.count("\t")
+        )
     printable_ratio_norm = printable_count / max(1, normalized_len)
     
     # Add text quality observations
@@ -1849,6 +2181,9 @@ async def upload_pdf(file: UploadFile = File(...), case_id: Optional[str] = Form
                 city_obs = o
             if not province_obs and o.get("field_key") == "consumer.current_address.province" and o.get("raw_value"):
                 province_obs = o
+            # Short-circuit: stop scanning once all four fields are satisfied
+            if line1_obs and postal_obs and city_obs and province_obs:
+                break
         
         line1_raw = line1_obs.get("raw_value") if line1_obs else None
         postal_code = postal_obs.get("raw_value") if postal_obs else None
@@ -1904,21 +2239,16 @@ async def upload_pdf(file: UploadFile = File(...), case_id: Optional[str] = Form
 
     # Update total text length if OCR escalation occurred
     if ocr_escalation_pages:
-        total_text_normalized = "\n".join(page_texts_normalized)
-        total_text_len = len(total_text_normalized)
-        # Update the doc.meta.text_length observation
-        for obs_item in observations:
-            if obs_item.get("field_key") == "doc.meta.text_length":
-                obs_item["raw_value"] = total_text_len
-                break
-    
+        # Sum per-page lengths (+1 per "\n" separator) instead of re-joining
+        # the whole document just to measure it.
+        total_text_len = sum(len(t) for t in page_texts_normalized) + max(0, len(page_texts_normalized) - 1)
+        # Update the doc.meta.text_length observation in place via the
+        # reference captured at creation (no list re-scan)
+        text_length_obs["raw_value"] = total_text_len
+
     # Update OCR audit to include escalation pages
-    if ocr_escalation_pages:
-        # Update ocr_pages_count if it exists
-        for obs_item in observations:
-            if obs_item.get("field_key") == "doc.meta.ocr_pages_count":
-                obs_item["raw_value"] = len(ocr_triggered_pages)
-                break
+    if ocr_escalation_pages and ocr_pages_count_obs is not None:
+        ocr_pages_count_obs["raw_value"] = len(ocr_triggered_pages)
 
     # Inquiry extraction v1 (deterministic) - use normalized page_texts for better extraction
     inquiry_observations = extract_inquiries_from_pages(page_texts_normalized, doc_id, ingestion_run_id)
@@ -1978,7 +2308,7 @@ async def upload_pdf(file: UploadFile = File(...), case_id: Optional[str] = Form
         {
             "ingestion_run_id": ingestion_run_id,
             "created_at": created_at,
-            "source_filename": file.filename,
+            "source_filename": filename,
             "stored_filename": stored_filename,
             "method": ingestion_path,
             "notes": notes,
@@ -1988,9 +2318,9 @@ async def upload_pdf(file: UploadFile = File(...), case_id: Optional[str] = Form
 
     result = {
         "doc_id": doc_id,
-        "filename": file.filename,
+        "filename": filename,
         "stored_as": stored_path,
-        "sha256": sha256_hex(content),
+        "sha256": sha256_digest,
         "ingestion_run_id": ingestion_run_id,
     }
     if case_id:
@@ -2001,38 +2331,17 @@ async def upload_pdf(file: UploadFile = File(...), case_id: Optional[str] = Form
 @app.get("/documents/{doc_id}/observations")
 def get_observations(doc_id: str):
     runs = load_ingestion_runs(OBSERVATIONS_DIR, doc_id)
-    data = load_observations(OBSERVATIONS_DIR, doc_id)
-    if not data:
-        raise HTTPException(status_code=404, detail="Document observations not found")
-    
-    # Handle backward compatibility: data might be a list (old format) or dict (new format)
-    if isinstance(data, list):
-        observations = data
-    else:
-        observations = data.get("observations", [])
-    
-    if not observations:
-        raise HTTPException(status_code=404, detail="Document observations not found")
+    _, observations = load_doc_observations(doc_id)
     return {"doc_id": doc_id, "ingestion_runs": runs, "observations": observations}
 
 
 
 @app.get("/documents/{doc_id}/entities")
 def get_entities(doc_id: str):
-    data = load_observations(OBSERVATIONS_DIR, doc_id)
-    if not data:
-        raise HTTPException(status_code=404, detail="Document observations not found")
-    
-    # Handle backward compatibility: data might be a list (old format) or dict (new format)
-    if isinstance(data, list):
-        observations = data
-    else:
-        observations = data.get("observations", [])
-    
-    if not observations:
-        raise HTTPException(status_code=404, detail="Document observations not found")
+    _, observations = load_doc_observations(doc_id)
 
     entities: Dict[str, Dict[str, Any]] = {}
+    entity_counts: Counter[str] = Counter()
 
     for o in observations:
         eid = o.get("entity_id")
@@ -2040,33 +2349,29 @@ def get_entities(doc_id: str):
             continue
 
         field_key = o.get("field_key", "")
-        entity_type = field_key.split(".", 1)[0] if "." in field_key else "unknown"
-
-        if eid not in entities:
-            entities[eid] = {
+        entity = entities.get(eid)
+        if entity is None:
+            entity_type = field_key.split(".", 1)[0] if "." in field_key else "unknown"
+            entity = entities[eid] = {
                 "entity_id": eid,
                 "entity_type": entity_type,
                 "field_count": 0,
                 "fields": set(),
                 "page_numbers": set(),
             }
+            entity_counts[entity_type] += 1
 
-        entities[eid]["field_count"] += 1
-        entities[eid]["fields"].add(field_key)
+        entity["field_count"] += 1
+        entity["fields"].add(field_key)
 
         pn = o.get("page_number")
         if pn is not None:
-            entities[eid]["page_numbers"].add(pn)
+            entity["page_numbers"].add(pn)
 
     for e in entities.values():
         e["fields"] = sorted(e["fields"])
         e["page_numbers"] = sorted(e["page_numbers"])
 
-    entity_counts: Dict[str, int] = {}
-    for e in entities.values():
-        t = e["entity_type"]
-        entity_counts[t] = entity_counts.get(t, 0) + 1
-
     return {
         "doc_id": doc_id,
         "entity_count": len(entities),
@@ -2083,11 +2388,9 @@ def get_document_text(doc_id: str, page: Optional[int] = None):
     - Caps preview to 4000 chars.
     """
     try:
-        data = load_observations(OBSERVATIONS_DIR, doc_id)
-        if not data:
-            raise HTTPException(status_code=404, detail="Document observations not found")
+        data, _ = load_doc_observations(doc_id)
 
-        # Handle backward compatibility: data might be a list (old format) or dict (new format)
+        # Handle backward compatibility: old format stored a bare list without page texts
         if isinstance(data, list):
             raise HTTPException(status_code=404, detail="Page texts not available for this document (pre-inquiry format)")
 
@@ -2154,19 +2457,8 @@ def get_document_text(doc_id: str, page: Optional[int] = None):
 
 @app.get("/documents/{doc_id}/resolved")
 def get_resolved(doc_id: str):
-    data = load_observations(OBSERVATIONS_DIR, doc_id)
-    if not data:
-        raise HTTPException(status_code=404, detail="Document observations not found")
-    
-    # Handle backward compatibility: data might be a list (old format) or dict (new format)
-    if isinstance(data, list):
-        observations = data
-    else:
-        observations = data.get("observations", [])
-    
-    if not observations:
-        raise HTTPException(status_code=404, detail="Document observations not found")
-    
+    _, observations = load_doc_observations(doc_id)
+
     # Load overrides and merge with resolved
     overrides = load_overrides(OBSERVATIONS_DIR, doc_id)
     resolved_with_overrides = get_resolved_with_overrides(doc_id, observations, overrides)
@@ -2183,18 +2475,7 @@ def get_resolved(doc_id: str):
 
 @app.get("/documents/{doc_id}/quality")
 def quality(doc_id: str):
-    data = load_observations(OBSERVATIONS_DIR, doc_id)
-    if not data:
-        raise HTTPException(status_code=404, detail="Document observations not found")
-    
-    # Handle backward compatibility: data might be a list (old format) or dict (new format)
-    if isinstance(data, list):
-        observations = data
-    else:
-        observations = data.get("observations", [])
-    
-    if not observations:
-        raise HTTPException(status_code=404, detail="Document observations not found")
+    _, observations = load_doc_observations(doc_id)
 
     # Load overrides and get resolved view (extracted merged with overrides)
     overrides = load_overrides(OBSERVATIONS_DIR, doc_id)
@@ -2274,11 +2555,8 @@ def quality(doc_id: str):
 @app.get("/documents/{doc_id}/overrides")
 def get_overrides(doc_id: str):
     """Get all overrides for a document."""
-    # Verify document exists
-    data = load_observations(OBSERVATIONS_DIR, doc_id)
-    if not data:
-        raise HTTPException(status_code=404, detail="Document observations not found")
-    
+    require_doc_exists(doc_id)
+
     overrides = load_overrides(OBSERVATIONS_DIR, doc_id)
     return {
         "doc_id": doc_id,
@@ -2294,13 +2572,10 @@ def upsert_override(
     note: Optional[str] = Form(None),
 ):
     """Upsert an override for a field. Creates or updates."""
-    # Verify document exists
-    data = load_observations(OBSERVATIONS_DIR, doc_id)
-    if not data:
-        raise HTTPException(status_code=404, detail="Document observations not found")
-    
+    require_doc_exists(doc_id)
+
     # Validate field_key exists in canonical fields
-    field_index_dict = {f.field_key: f for f in canonical_fields()}
+    field_index_dict = field_index()
     if field_key not in field_index_dict:
         raise HTTPException(status_code=400, detail=f"Unknown field_key: {field_key}")
     
@@ -2318,11 +2593,8 @@ def upsert_override(
 @app.delete("/documents/{doc_id}/overrides/{field_key}")
 def delete_override_endpoint(doc_id: str, field_key: str):
     """Delete an override for a field."""
-    # Verify document exists
-    data = load_observations(OBSERVATIONS_DIR, doc_id)
-    if not data:
-        raise HTTPException(status_code=404, detail="Document observations not found")
-    
+    require_doc_exists(doc_id)
+
     deleted = delete_override(OBSERVATIONS_DIR, doc_id, field_key)
     if not deleted:
         raise HTTPException(status_code=404, detail=f"Override not found for field_key: {field_key}")
@@ -2342,7 +2614,7 @@ def case_quality(case_id: str):
     Detects conflicts when multiple documents have different values for the same required field.
     """
     # Get all document IDs for this case
-    doc_ids = get_case_doc_ids(OBSERVATIONS_DIR, case_id)
+    doc_ids = get_case_doc_ids_cached(case_id)
     if not doc_ids:
         raise HTTPException(status_code=404, detail=f"Case {case_id} not found or has no documents")
     
@@ -2351,16 +2623,17 @@ def case_quality(case_id: str):
     doc_observations_map: Dict[str, List[Dict[str, Any]]] = {}
     
     for doc_id in doc_ids:
-        data = load_observations(OBSERVATIONS_DIR, doc_id)
+        paths = ensure_doc_dirs(OBSERVATIONS_DIR, doc_id)
+        data = _observations_data_cached(doc_id, stat_mtime_ns(paths["observations"]))
         if not data:
             continue
-        
+
         # Handle backward compatibility
         if isinstance(data, list):
             observations = data
         else:
             observations = data.get("observations", [])
-        
+
         if observations:
             all_observations.extend(observations)
             doc_observations_map[doc_id] = observations
@@ -2368,72 +2641,77 @@ def case_quality(case_id: str):
     if not all_observations:
         raise HTTPException(status_code=404, detail=f"No observations found for case {case_id}")
     
-    # Group observations by field_key (including entity_id for entity-scoped fields)
-    field_observations: Dict[str, List[Dict[str, Any]]] = {}
-    for obs in all_observations:
-        field_key = obs.get("field_key", "")
-        entity_id = obs.get("entity_id")
-        
-        # For entity-scoped fields, include entity_id in the key
-        if entity_id:
-            full_key = f"{entity_id}.{field_key}"
-        else:
-            full_key = field_key
-        
-        if full_key not in field_observations:
-            field_observations[full_key] = []
-        field_observations[full_key].append(obs)
-    
     # Merge observations: for each field, pick the best observation (highest confidence, most recent)
     # Track conflicts for required fields
     merged_fields: Dict[str, Dict[str, Any]] = {}
     conflicts: Dict[str, List[Dict[str, Any]]] = {}
     required = required_field_keys()
-    
-    for full_key, obs_list in field_observations.items():
-        # Extract base field_key (without entity_id prefix for required field check)
-        base_field_key = full_key.split(".", 1)[-1] if "." in full_key else full_key
-        
-        # Filter to only extracted observations (not missing)
-        extracted_obs = [o for o in obs_list if o.get("status") == "extracted" and o.get("raw_value") is not None]
-        
-        if not extracted_obs:
+    required_set = required_field_key_set()
+
+    def obs_rank(x: Dict[str, Any]) -> Tuple[float, str]:
+        return (float(x.get("confidence", 0.0)), x.get("created_at", ""))
+
+    # Single pass over all observations: track the best-so-far per full_key
+    # (entity_id-prefixed for entity-scoped fields) and the distinct values
+    # seen for required fields, instead of materializing dict-of-lists groups.
+    best_obs_by_key: Dict[str, Dict[str, Any]] = {}
+    best_rank_by_key: Dict[str, Tuple[float, str]] = {}
+    base_key_by_key: Dict[str, str] = {}
+    seen_values: Dict[str, Set[str]] = defaultdict(set)
+
+    for obs in all_observations:
+        if obs.get("status") != "extracted" or obs.get("raw_value") is None:
             continue
-        
-        # Sort by confidence (desc) then created_at (desc)
-        extracted_obs.sort(key=lambda x: (
-            float(x.get("confidence", 0.0)),
-            x.get("created_at", "")
-        ), reverse=True)
-        
-        best_obs = extracted_obs[0]
-        best_value = best_obs.get("raw_value")
-        
-        # Check for conflicts: if this is a required field and we have multiple different values
-        if base_field_key in required:
-            unique_values = set()
-            for o in extracted_obs:
-                val = o.get("raw_value")
-                if val is not None:
-                    unique_values.add(str(val))
-            
-            if len(unique_values) > 1:
-                # Conflict detected - include all candidates with provenance
-                conflicts[base_field_key] = []
-                for o in extracted_obs[:5]:  # Limit to top 5 candidates
-                    conflicts[base_field_key].append({
-                        "value": o.get("raw_value"),
-                        "confidence": o.get("confidence", 0.0),
-                        "method": o.get("method", "unknown"),
-                        "doc_id": o.get("doc_id"),
-                        "page_number": o.get("page_number"),
-                        "obs_id": o.get("obs_id"),
-                        "anchor": o.get("anchor", {}),
-                    })
-        
-        # Store merged field with provenance
+
+        field_key = obs.get("field_key", "")
+        entity_id = obs.get("entity_id")
+        full_key = f"{entity_id}.{field_key}" if entity_id else field_key
+
+        base_field_key = base_key_by_key.get(full_key)
+        if base_field_key is None:
+            base_field_key = full_key.split(".", 1)[-1] if "." in full_key else full_key
+            base_key_by_key[full_key] = base_field_key
+
+        rank = obs_rank(obs)
+        prev_rank = best_rank_by_key.get(full_key)
+        if prev_rank is None or rank > prev_rank:
+            best_obs_by_key[full_key] = obs
+            best_rank_by_key[full_key] = rank
+
+        if base_field_key in required_set:
+            seen_values[full_key].add(str(obs.get("raw_value")))
+
+    # Conflict candidates need the top 5 per conflicting key, so sweep again
+    # but only collecting observations for keys that actually conflict.
+    conflicting_keys = {k for k, vals in seen_values.items() if len(vals) > 1}
+    if conflicting_keys:
+        conflict_candidates: Dict[str, List[Dict[str, Any]]] = {k: [] for k in conflicting_keys}
+        for obs in all_observations:
+            if obs.get("status") != "extracted" or obs.get("raw_value") is None:
+                continue
+            entity_id = obs.get("entity_id")
+            full_key = f"{entity_id}.{obs.get('field_key', '')}" if entity_id else obs.get("field_key", "")
+            if full_key in conflicting_keys:
+                conflict_candidates[full_key].append(obs)
+
+        for full_key in conflicting_keys:
+            conflicts[base_key_by_key[full_key]] = [
+                {
+                    "value": o.get("raw_value"),
+                    "confidence": o.get("confidence", 0.0),
+                    "method": o.get("method", "unknown"),
+                    "doc_id": o.get("doc_id"),
+                    "page_number": o.get("page_number"),
+                    "obs_id": o.get("obs_id"),
+                    "anchor": o.get("anchor", {}),
+                }
+                for o in heapq.nlargest(5, conflict_candidates[full_key], key=obs_rank)
+            ]
+
+    # Store merged fields with provenance
+    for full_key, best_obs in best_obs_by_key.items():
         merged_fields[full_key] = {
-            "value": best_value,
+            "value": best_obs.get("raw_value"),
             "confidence": best_obs.get("confidence", 0.0),
             "method": best_obs.get("method", "unknown"),
             "doc_id": best_obs.get("doc_id"),
@@ -2441,12 +2719,12 @@ def case_quality(case_id: str):
             "obs_id": best_obs.get("obs_id"),
             "anchor": best_obs.get("anchor", {}),
         }
-    
+
     # Calculate merged required fields missing
     present_required_keys = set()
     for full_key in merged_fields.keys():
-        base_field_key = full_key.split(".", 1)[-1] if "." in full_key else full_key
-        if base_field_key in required:
+        base_field_key = base_key_by_key[full_key]
+        if base_field_key in required_set:
             present_required_keys.add(base_field_key)
     
     merged_missing_required = [k for k in required if k not in present_required_keys]
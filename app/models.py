@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, ForeignKey, DateTime, Text
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, DateTime, Index, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -32,3 +32,12 @@ class Observation(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     document = relationship("Document", back_populates="observations")
+
+# Covers the per-document read pattern (WHERE doc_id ORDER BY field_key,
+# confidence DESC) as a single index range scan instead of an in-memory sort.
+Index(
+    "ix_observations_doc_field_conf",
+    Observation.doc_id,
+    Observation.field_key,
+    Observation.confidence.desc(),
+)
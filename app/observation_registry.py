@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -16,11 +16,7 @@ class FieldDef:
     examples: Optional[List[Any]] = None
 
 
-def canonical_fields() -> List[FieldDef]:
-    """
-    Canonical observation fields for Consumer Credit Reports (v1).
-    This is a contract: stable keys, stable meaning.
-    """
+def _build_canonical_fields() -> Tuple[FieldDef, ...]:
     fields: List[FieldDef] = [
         # --------------------
         # Document meta
@@ -118,12 +114,35 @@ def canonical_fields() -> List[FieldDef]:
         FieldDef("fraud_alert.contact_phone", "Fraud alert phone", "document", "string"),
         FieldDef("consumer_statement.text", "Consumer statement", "document", "string"),
     ]
-    return fields
+    return tuple(fields)
+
+
+# The registry is a stable contract, so it and its derived views are built
+# exactly once at import and shared instead of rebuilt per call.
+_CANONICAL_FIELDS: Tuple[FieldDef, ...] = _build_canonical_fields()
+_FIELD_INDEX: Dict[str, FieldDef] = {f.field_key: f for f in _CANONICAL_FIELDS}
+_REQUIRED_FIELD_KEYS: Tuple[str, ...] = tuple(
+    f.field_key for f in _CANONICAL_FIELDS if f.required
+)
+_REQUIRED_FIELD_KEY_SET: frozenset = frozenset(_REQUIRED_FIELD_KEYS)
+
+
+def canonical_fields() -> Tuple[FieldDef, ...]:
+    """
+    Canonical observation fields for Consumer Credit Reports (v1).
+    This is a contract: stable keys, stable meaning.
+    """
+    return _CANONICAL_FIELDS
 
 
 def field_index() -> Dict[str, FieldDef]:
-    return {f.field_key: f for f in canonical_fields()}
+    return _FIELD_INDEX
+
+
+def required_field_keys() -> Tuple[str, ...]:
+    return _REQUIRED_FIELD_KEYS
 
 
-def required_field_keys() -> List[str]:
-    return [f.field_key for f in canonical_fields() if f.required]
+def required_field_key_set() -> frozenset:
+    """Frozenset view of required_field_keys() for membership tests."""
+    return _REQUIRED_FIELD_KEY_SET
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 import os
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 
 def _doc_dir(base_dir: str, doc_id: str) -> str:
     return os.path.join(base_dir, doc_id)
@@ -30,14 +31,17 @@ def ensure_doc_dirs(base_dir: str, doc_id: str) -> Dict[str, str]:
 
 
 def write_json(path: str, payload: Any) -> None:
+    # orjson serializes the large observation/page-text payloads far faster
+    # than stdlib json; OPT_INDENT_2 keeps the on-disk files diffable and
+    # the output stays UTF-8 (orjson never ASCII-escapes).
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, ensure_ascii=False)
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
 
 def read_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 def load_ingestion_runs(obs_base_dir: str, doc_id: str) -> List[Dict[str, Any]]:
@@ -52,6 +56,12 @@ def save_ingestion_runs(obs_base_dir: str, doc_id: str, runs: List[Dict[str, Any
     write_json(paths["ingestion_runs"], runs)
 
 
+def document_exists(obs_base_dir: str, doc_id: str) -> bool:
+    """Cheap existence check: stats observations.json without parsing it."""
+    paths = ensure_doc_dirs(obs_base_dir, doc_id)
+    return os.path.exists(paths["observations"])
+
+
 def load_observations(obs_base_dir: str, doc_id: str) -> List[Dict[str, Any]]:
     paths = ensure_doc_dirs(obs_base_dir, doc_id)
     if not os.path.exists(paths["observations"]):
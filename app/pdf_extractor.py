@@ -10,18 +10,96 @@ NAME_CLEAN_RE = re.compile(r"[^A-Za-z \-'.]", re.IGNORECASE)
 
 # TransUnion-specific patterns
 # Pattern: "Current" on one line, then address + date on next line(s)
+# addr is bounded (1-200 chars) so a missing date cannot send the lazy
+# quantifier crawling across the rest of the page under DOTALL.
 TU_CURRENT_ADDRESS_RE = re.compile(
-    r"(?im)^\s*Current\s*$[\r\n]+^\s*(?P<addr>.+?)\s+(?P<date>\d{2}/\d{2}/\d{4})",
+    r"(?im)^\s*Current\s*$[\r\n]+^\s*(?P<addr>.{1,200}?)\s+(?P<date>\d{2}/\d{2}/\d{4})",
     re.MULTILINE | re.DOTALL
 )
 TU_NAME_RE = re.compile(r"(?i)^\s*Name\s+(?P<name>[A-Z\s]+?)\s+(\d{2}/\d{2}/\d{4})", re.MULTILINE)
 
+# Fallback patterns (compiled once at import, not per call)
+TU_CURRENT_ADDRESS_SIMPLE_RE = re.compile(
+    r"(?i)Current\s+(?P<addr>[^\r\n]{1,200}?)\s+(\d{2}/\d{2}/\d{4})",
+    re.MULTILINE
+)
+TU_NAME_SIMPLE_RE = re.compile(
+    r"(?i)^\s*Name\s+(?P<name>[A-Z]+(?:[A-Z\s]+[A-Z]+)?)\s+(\d{2}/\d{2}/\d{4})",
+    re.MULTILINE
+)
+
 # OCR-tolerant Canadian postal code: allow O where digit expected
 TU_POSTAL_CANDIDATE_RE = re.compile(r"[A-Z][0-9O][A-Z][0-9O][A-Z][0-9O]", re.IGNORECASE)
 
+# Fixed patterns used inside per-line/per-page loops below, compiled once at
+# import instead of round-tripping through re's internal cache on every call.
+WHITESPACE_RUN_RE = re.compile(r"\s+")
+NON_ALPHA_RE = re.compile(r"[^A-Za-z]")
+NON_ALPHA_SPACE_RE = re.compile(r"[^A-Za-z\s]")
+NON_WORD_RE = re.compile(r"[^\w]")
+LEADING_NON_WORD_RE = re.compile(r"^[^\w]+")
+TRAILING_NON_WORD_RE = re.compile(r"[^\w]+$")
+TRAILING_PUNCT_RE = re.compile(r"[^\w\s]+$")
+DIGIT_RUN_RE = re.compile(r"\d+")
+CITY_WORD_RE = re.compile(r"([A-Za-z]{4,})")
+STREET_NUMBER_RE = re.compile(r"\b\d{1,6}\b")
+
+# TransUnion "Personal Information" name section
+PERSONAL_INFO_RE = re.compile(r"\bPersonal\s+Information\b", re.IGNORECASE)
+PI_STOP_HEADER_RE = re.compile(
+    r"^\s*(Address|Tradelines|Accounts|Collections|Public Records|Summary)\b", re.IGNORECASE
+)
+GIVEN_NAME_LABEL_RE = re.compile(r"\bGiven\s+Name", re.IGNORECASE)
+GIVEN_NAME_VALUE_RE = re.compile(r"Given\s+Name(?:\(s\))?\s*:?\s*([A-Z][A-Z\s]+)", re.IGNORECASE)
+MIDDLE_NAME_LABEL_RE = re.compile(r"\bMiddle\s+Name", re.IGNORECASE)
+MIDDLE_NAME_VALUE_RE = re.compile(r"Middle\s+Name\s*:?\s*([A-Z][A-Z\s]*)", re.IGNORECASE)
+SURNAME_LABEL_RE = re.compile(r"\bSurname", re.IGNORECASE)
+SURNAME_VALUE_RE = re.compile(r"Surname\s*:?\s*([A-Z][A-Z\s]+)", re.IGNORECASE)
+UPPER_NAME_LINE_RE = re.compile(r"^[A-Z][A-Z\s]+$")
+UPPER_NAME_LINE_OPT_RE = re.compile(r"^[A-Z][A-Z\s]*$")
+
+# TransUnion "Address(es):" table section
+ADDRESSES_HEADER_RE = re.compile(r"\bAddress(?:\(es\))?\s*:", re.IGNORECASE)
+MOST_CURRENT_RE = re.compile(r"most\s+current|listed\s+first", re.IGNORECASE)
+ADDR_STOP_HEADER_RE = re.compile(
+    r"^\s*(Previous\s+Address|Investigation|Tradelines|Accounts|Collections|Public Records|Summary|Personal Information)\b",
+    re.IGNORECASE,
+)
+ADDR_COLUMN_HEADER_RE = re.compile(r"^\s*(Address|City|Province|Postal|Since)\s*$", re.IGNORECASE)
+SINCE_DATE_RE = re.compile(r"(\d{1,2}/\d{2,4})")
+STREET_PREFIX_RE = re.compile(
+    r"^\d+[A-Z]?\s+[A-Z\s]+(?:ST|STREET|AVE|AVENUE|RD|ROAD|BLVD|BOULEVARD|DR|DRIVE|CT|COURT|LN|LANE|PL|PLACE|WAY|CIRCLE|CIR)\s*",
+    re.IGNORECASE,
+)
+PO_BOX_RE = re.compile(r"PO\s+BOX\s+\d+\s*", re.IGNORECASE)
+APT_RE = re.compile(r"APT\s+\d+\s*", re.IGNORECASE)
+UNIT_RE = re.compile(r"UNIT\s+\d+\s*", re.IGNORECASE)
+
+# Generic fallback extraction
+TRANSUNION_WORD_RE = re.compile(r"\btransunion\b", re.IGNORECASE)
+CONSUMER_INFO_RE = re.compile(r"\bconsumer\s+information\b", re.IGNORECASE)
+ADDRESS_WORD_RE = re.compile(r"\baddress\b", re.IGNORECASE)
+ADDRESS_VALUE_RE = re.compile(r"\baddress\b\s*[:\-]?\s*(.+)", re.IGNORECASE)
+# Bounded capture: candidates are truncated to 80 chars below anyway, and an
+# explicit bound keeps the engine from scanning to line end on pathological
+# OCR lines.
+GENERIC_NAME_PATTERNS = [
+    re.compile(r"(?:\bconsumer\s+name\b|\bname\b)\s*[:\-]\s*([^\n\r]{1,200})", re.IGNORECASE),
+]
+ADDRESS_HEADER_PATTERNS = [
+    re.compile(r"\bcurrent\s+address\b", re.IGNORECASE),
+    re.compile(r"\baddress\b", re.IGNORECASE),
+    re.compile(r"\bresidential\s+address\b", re.IGNORECASE),
+]
+
+# Literals that must appear on a page before the generic identity regexes are
+# worth running. One compiled alternation scans the page in a single C-level
+# pass (stopping at the first hit) instead of one lowered-copy scan per literal.
+IDENTITY_GATE_RE = re.compile(r"name|address|consumer information", re.IGNORECASE)
+
 
 def normalize_whitespace(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    return WHITESPACE_RUN_RE.sub(" ", (s or "").strip())
 
 
 def find_can_postal(text: str) -> Optional[str]:
@@ -87,11 +165,7 @@ def extract_tu_current_address(text: str) -> Optional[str]:
     
     # Fallback: try simpler pattern if multiline didn't match
     # "Current" followed by address on same or next line
-    simple_pattern = re.compile(
-        r"(?i)Current\s+(?P<addr>[^\r\n]+?)\s+(\d{2}/\d{2}/\d{4})",
-        re.MULTILINE
-    )
-    m = simple_pattern.search(text)
+    m = TU_CURRENT_ADDRESS_SIMPLE_RE.search(text)
     if m:
         addr = m.group("addr").strip()
         if addr.lower().startswith("previous"):
@@ -205,14 +279,14 @@ def parse_canadian_city_province_from_glued_tail(addr_raw: str, postal: str) ->
     # Extract city from original (preserve original case)
     if city_start_original < prov_start_original:
         city_raw = addr_raw[city_start_original:prov_start_original]
-        city_clean = re.sub(r'[^A-Za-z]', '', city_raw)
+        city_clean = NON_ALPHA_RE.sub('', city_raw)
         
         # Validate city length
         if len(city_clean) >= 2:
             # Step 7: Clean line1 by removing glued tail
             line1_clean = addr_raw[:city_start_original].strip()
             # Remove trailing non-alphanumeric characters
-            line1_clean = re.sub(r'[^\w\s]+$', '', line1_clean).strip()
+            line1_clean = TRAILING_PUNCT_RE.sub('', line1_clean).strip()
             
             # Step 8: Return results
             province = prov_candidate
@@ -265,8 +339,7 @@ def parse_tu_address(addr_str: str) -> Dict[str, Optional[str]]:
         
         # Find the last sequence of digits/numbers before province
         # This often marks the end of line1 (e.g., "PO BOX 593" or "APT 123")
-        digit_pattern = re.compile(r'\d+')
-        digit_matches = list(digit_pattern.finditer(before_prov))
+        digit_matches = list(DIGIT_RUN_RE.finditer(before_prov))
         
         if digit_matches:
             # Use the last digit sequence as potential boundary
@@ -274,13 +347,13 @@ def parse_tu_address(addr_str: str) -> Dict[str, Optional[str]]:
             # City candidate is everything after last digit sequence
             city_candidate = before_prov[last_digit_end:].strip()
             # Remove non-alphabetic characters from start/end
-            city_candidate = re.sub(r'^[^\w]+', '', city_candidate)
-            city_candidate = re.sub(r'[^\w]+$', '', city_candidate)
-            
+            city_candidate = LEADING_NON_WORD_RE.sub('', city_candidate)
+            city_candidate = TRAILING_NON_WORD_RE.sub('', city_candidate)
+
             # Extract city (should be alphabetic, 4+ chars)
-            if city_candidate and len(re.sub(r'[^\w]', '', city_candidate)) >= 4:
+            if city_candidate and len(NON_WORD_RE.sub('', city_candidate)) >= 4:
                 # Take the first word-like sequence as city
-                city_match = re.search(r'([A-Za-z]{4,})', city_candidate)
+                city_match = CITY_WORD_RE.search(city_candidate)
                 if city_match:
                     result["city"] = city_match.group(1).title()
                     # Remove city from before_prov
@@ -297,7 +370,7 @@ def parse_tu_address(addr_str: str) -> Dict[str, Optional[str]]:
             if words:
                 # Look for last word that's 4+ chars, alphabetic
                 for word in reversed(words):
-                    word_clean = re.sub(r'[^\w]', '', word)
+                    word_clean = NON_WORD_RE.sub('', word)
                     if len(word_clean) >= 4 and word_clean.isalpha():
                         result["city"] = word_clean.title()
                         # Remove city from line1
@@ -364,11 +437,7 @@ def extract_tu_full_name(text: str) -> Optional[str]:
             return name.upper() if name.isupper() else name
     
     # Fallback: simpler pattern for "Name" followed by all-caps text then date
-    simple_pattern = re.compile(
-        r"(?i)^\s*Name\s+(?P<name>[A-Z]+(?:[A-Z\s]+[A-Z]+)?)\s+(\d{2}/\d{2}/\d{4})",
-        re.MULTILINE
-    )
-    m = simple_pattern.search(text)
+    m = TU_NAME_SIMPLE_RE.search(text)
     if m:
         name = m.group("name").strip()
         if name and len(name) >= 4:  # Minimum reasonable name length
@@ -392,7 +461,7 @@ def extract_tu_personal_information_name(page_texts: List[str]) -> Optional[Tupl
         page_num = idx + 1
         
         # Look for "Personal Information" section
-        if not re.search(r"\bPersonal\s+Information\b", text, re.IGNORECASE):
+        if not PERSONAL_INFO_RE.search(text):
             continue
         
         lines = text.splitlines()
@@ -403,50 +472,48 @@ def extract_tu_personal_information_name(page_texts: List[str]) -> Optional[Tupl
         # Find the Personal Information section
         in_section = False
         for i, line in enumerate(lines):
-            line_lower = line.lower()
-            
             # Start of section
-            if re.search(r"\bPersonal\s+Information\b", line, re.IGNORECASE):
+            if PERSONAL_INFO_RE.search(line):
                 in_section = True
                 continue
             
             # End of section (next major section)
-            if in_section and re.search(r"^\s*(Address|Tradelines|Accounts|Collections|Public Records|Summary)\b", line, re.IGNORECASE):
+            if in_section and PI_STOP_HEADER_RE.search(line):
                 break
             
             if not in_section:
                 continue
             
             # Extract Given Name(s)
-            if re.search(r"\bGiven\s+Name", line, re.IGNORECASE):
+            if GIVEN_NAME_LABEL_RE.search(line):
                 # Look for pattern like "Given Name(s): DAVID PHILIP" or "Given Name(s) DAVID PHILIP"
-                match = re.search(r"Given\s+Name(?:\(s\))?\s*:?\s*([A-Z][A-Z\s]+)", line, re.IGNORECASE)
+                match = GIVEN_NAME_VALUE_RE.search(line)
                 if match:
                     given_name = match.group(1).strip()
                 # Also check next line if current line is just the label
                 elif i + 1 < len(lines):
                     next_line = lines[i + 1].strip()
-                    if next_line and re.match(r"^[A-Z][A-Z\s]+$", next_line):
+                    if next_line and UPPER_NAME_LINE_RE.match(next_line):
                         given_name = next_line.strip()
             
             # Extract Middle Name
-            if re.search(r"\bMiddle\s+Name", line, re.IGNORECASE):
-                match = re.search(r"Middle\s+Name\s*:?\s*([A-Z][A-Z\s]*)", line, re.IGNORECASE)
+            if MIDDLE_NAME_LABEL_RE.search(line):
+                match = MIDDLE_NAME_VALUE_RE.search(line)
                 if match:
                     middle_name = match.group(1).strip()
                 elif i + 1 < len(lines):
                     next_line = lines[i + 1].strip()
-                    if next_line and re.match(r"^[A-Z][A-Z\s]*$", next_line):
+                    if next_line and UPPER_NAME_LINE_OPT_RE.match(next_line):
                         middle_name = next_line.strip()
             
             # Extract Surname
-            if re.search(r"\bSurname", line, re.IGNORECASE):
-                match = re.search(r"Surname\s*:?\s*([A-Z][A-Z\s]+)", line, re.IGNORECASE)
+            if SURNAME_LABEL_RE.search(line):
+                match = SURNAME_VALUE_RE.search(line)
                 if match:
                     surname = match.group(1).strip()
                 elif i + 1 < len(lines):
                     next_line = lines[i + 1].strip()
-                    if next_line and re.match(r"^[A-Z][A-Z\s]+$", next_line):
+                    if next_line and UPPER_NAME_LINE_RE.match(next_line):
                         surname = next_line.strip()
         
         # Build full name from components
@@ -487,14 +554,14 @@ def extract_tu_addresses_table(page_texts: List[str]) -> Optional[Tuple[int, Dic
         page_num = idx + 1
         
         # Look for "Address(es):" section header
-        addresses_match = re.search(r"\bAddress(?:\(es\))?\s*:", text, re.IGNORECASE)
+        addresses_match = ADDRESSES_HEADER_RE.search(text)
         if not addresses_match:
             continue
         
         # Verify this is the authoritative section (should mention "most current")
         section_start = addresses_match.start()
         section_text = text[section_start:section_start + 500]  # Look ahead 500 chars
-        if not re.search(r"most\s+current|listed\s+first", section_text, re.IGNORECASE):
+        if not MOST_CURRENT_RE.search(section_text):
             continue
         
         lines = text.splitlines()
@@ -521,11 +588,11 @@ def extract_tu_addresses_table(page_texts: List[str]) -> Optional[Tuple[int, Dic
                 continue
             
             # Stop if we hit another major section
-            if re.search(r"^\s*(Previous\s+Address|Investigation|Tradelines|Accounts|Collections|Public Records|Summary|Personal Information)\b", line, re.IGNORECASE):
+            if ADDR_STOP_HEADER_RE.search(line):
                 break
-            
+
             # Skip header lines
-            if re.search(r"^\s*(Address|City|Province|Postal|Since)\s*$", line, re.IGNORECASE):
+            if ADDR_COLUMN_HEADER_RE.search(line):
                 continue
             
             # Try to parse as address row - look for postal code or province
@@ -554,7 +621,7 @@ def extract_tu_addresses_table(page_texts: List[str]) -> Optional[Tuple[int, Dic
                 }
                 
                 # Extract since_date if present (format: MM/YYYY or MM/DD/YYYY)
-                since_match = re.search(r"(\d{1,2}/\d{2,4})", line)
+                since_match = SINCE_DATE_RE.search(line)
                 if since_match:
                     addr_dict["since_date"] = since_match.group(1)
                 
@@ -567,10 +634,10 @@ def extract_tu_addresses_table(page_texts: List[str]) -> Optional[Tuple[int, Dic
                         # Remove address line parts first
                         city_candidate = before_prov
                         # Remove common address patterns
-                        city_candidate = re.sub(r"^\d+[A-Z]?\s+[A-Z\s]+(?:ST|STREET|AVE|AVENUE|RD|ROAD|BLVD|BOULEVARD|DR|DRIVE|CT|COURT|LN|LANE|PL|PLACE|WAY|CIRCLE|CIR)\s*", "", city_candidate, flags=re.IGNORECASE)
-                        city_candidate = re.sub(r"PO\s+BOX\s+\d+\s*", "", city_candidate, flags=re.IGNORECASE)
-                        city_candidate = re.sub(r"APT\s+\d+\s*", "", city_candidate, flags=re.IGNORECASE)
-                        city_candidate = re.sub(r"UNIT\s+\d+\s*", "", city_candidate, flags=re.IGNORECASE)
+                        city_candidate = STREET_PREFIX_RE.sub("", city_candidate)
+                        city_candidate = PO_BOX_RE.sub("", city_candidate)
+                        city_candidate = APT_RE.sub("", city_candidate)
+                        city_candidate = UNIT_RE.sub("", city_candidate)
                         city_candidate = city_candidate.strip()
                         
                         # Extract the last word sequence as city (should be 2+ chars, alphabetic)
@@ -578,7 +645,7 @@ def extract_tu_addresses_table(page_texts: List[str]) -> Optional[Tuple[int, Dic
                         if city_words:
                             # Take the last word or last few words as city
                             city = city_words[-1] if len(city_words) == 1 else " ".join(city_words[-2:])
-                            city = re.sub(r"[^A-Za-z\s]", "", city).strip()
+                            city = NON_ALPHA_SPACE_RE.sub("", city).strip()
                             if city and len(city) >= 2:
                                 addr_dict["city"] = city
                                 
@@ -595,7 +662,7 @@ def extract_tu_addresses_table(page_texts: List[str]) -> Optional[Tuple[int, Dic
                         # Try to find city as last capitalized word before province
                         words = before_prov.split()
                         for word in reversed(words):
-                            word_clean = re.sub(r"[^A-Za-z]", "", word)
+                            word_clean = NON_ALPHA_RE.sub("", word)
                             if len(word_clean) >= 2 and word_clean[0].isupper():
                                 addr_dict["city"] = word_clean
                                 # Address line is before city
@@ -652,7 +719,7 @@ def extract_identity_from_pages(page_texts: List[str], bureau: Optional[str] = N
     if not is_transunion:
         # Try to detect from text patterns
         combined_text = "\n".join(page_texts)
-        is_transunion = bool(re.search(r"\btransunion\b", combined_text, re.IGNORECASE))
+        is_transunion = bool(TRANSUNION_WORD_RE.search(combined_text))
     
     # For TransUnion: prioritize Address(es) table and Personal Information section
     if is_transunion:
@@ -721,23 +788,18 @@ def extract_identity_from_pages(page_texts: List[str], bureau: Optional[str] = N
     # Fall back to generic extraction
     name_candidates: List[Tuple[int, str, int]] = []
 
-    name_patterns = [
-        re.compile(r"(?:\bconsumer\s+name\b|\bname\b)\s*[:\-]\s*(.+)", re.IGNORECASE),
-    ]
-
-    address_header_patterns = [
-        re.compile(r"\bcurrent\s+address\b", re.IGNORECASE),
-        re.compile(r"\baddress\b", re.IGNORECASE),
-        re.compile(r"\bresidential\s+address\b", re.IGNORECASE),
-    ]
-
     address_blocks: List[Tuple[int, str]] = []
 
     for idx, raw in enumerate(page_texts):
         page_num = idx + 1
         text = raw or ""
 
-        for pat in name_patterns:
+        # Fast multi-literal gate: most pages contain no name or address
+        # header at all, so skip the regex passes entirely for them.
+        if IDENTITY_GATE_RE.search(text) is None:
+            continue
+
+        for pat in GENERIC_NAME_PATTERNS:
             for m in pat.finditer(text):
                 cand = normalize_whitespace(m.group(1))
                 cand = cand.split("  ")[0].strip()
@@ -746,10 +808,10 @@ def extract_identity_from_pages(page_texts: List[str], bureau: Optional[str] = N
                 if looks_like_name(cand):
                     name_candidates.append((page_num, cand, score_name_candidate(cand)))
 
-        if re.search(r"\bconsumer\s+information\b", text, re.IGNORECASE):
+        if CONSUMER_INFO_RE.search(text):
             lines = [normalize_whitespace(x) for x in text.splitlines() if normalize_whitespace(x)]
             for i, line in enumerate(lines[:40]):
-                if re.search(r"\bconsumer\s+information\b", line, re.IGNORECASE):
+                if CONSUMER_INFO_RE.search(line):
                     for nxt in lines[i + 1:i + 6]:
                         if looks_like_name(nxt):
                             name_candidates.append((page_num, nxt, score_name_candidate(nxt) + 2))
@@ -758,13 +820,13 @@ def extract_identity_from_pages(page_texts: List[str], bureau: Optional[str] = N
         for i, line in enumerate(lines):
             if not line:
                 continue
-            if any(h.search(line) for h in address_header_patterns):
+            if any(h.search(line) for h in ADDRESS_HEADER_PATTERNS):
                 block_lines: List[str] = []
                 for j in range(i, min(i + 8, len(lines))):
                     if lines[j]:
                         block_lines.append(lines[j])
                 block = "\n".join(block_lines).strip()
-                if find_can_postal(block) or re.search(r"\b\d{1,6}\b", block):
+                if find_can_postal(block) or STREET_NUMBER_RE.search(block):
                     address_blocks.append((page_num, block))
 
     best_name = None
@@ -782,7 +844,7 @@ def extract_identity_from_pages(page_texts: List[str], bureau: Optional[str] = N
             score += 5
         if find_province(block):
             score += 3
-        if re.search(r"\b\d{1,6}\b", block):
+        if STREET_NUMBER_RE.search(block):
             score += 1
         if page_num == 1:
             score += 2
@@ -824,9 +886,9 @@ def extract_identity_from_pages(page_texts: List[str], bureau: Optional[str] = N
             # Never use a line that starts with "Previous"
             if line.lower().strip().startswith("previous"):
                 continue
-            if re.search(r"\b\d{1,6}\b", line) and sum(c.isalpha() for c in line) >= 4:
-                if re.search(r"\baddress\b", line, re.IGNORECASE):
-                    m = re.search(r"\baddress\b\s*[:\-]?\s*(.+)", line, re.IGNORECASE)
+            if STREET_NUMBER_RE.search(line) and sum(c.isalpha() for c in line) >= 4:
+                if ADDRESS_WORD_RE.search(line):
+                    m = ADDRESS_VALUE_RE.search(line)
                     if m:
                         candidate = normalize_whitespace(m.group(1))
                         if candidate and not candidate.lower().startswith("previous"):
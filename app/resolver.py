@@ -40,53 +40,44 @@ def apply_tu_precedence(
     items: List[Dict[str, Any]],
     bureau: Optional[str],
     all_observations: List[Dict[str, Any]],
-) -> List[Dict[str, Any]]:
+) -> List[int]:
     """
-    Apply TransUnion precedence rules to observation items.
-    
+    Compute TransUnion precedence priorities for observation items.
+
     For TransUnion reports:
     - Address fields: prioritize Address(es) table, ignore Previous Address
     - Full name: prioritize Personal Information section
-    
-    Adds a _tu_priority field to items to ensure correct sorting order.
-    Higher priority = sorted first.
+
+    Returns a list of priorities aligned with items (2 = highest, 1 = normal,
+    0 = lowest, sorted last). The observations themselves are never modified,
+    so callers may share them across requests.
     """
+    priorities = [1] * len(items)
     if bureau != "TransUnion":
-        return items
-    
+        return priorities
+
     # Address fields: prioritize Address(es) table, filter out Previous Address
     if field_key.startswith("consumer.current_address."):
         # Check if ANY address field observation (across all fields) is from Address(es) table
         addresses_table_pages = get_addresses_table_pages(all_observations)
-        
+
         if addresses_table_pages:
-            # Mark items with priority: Address(es) table page = priority 2, others = priority 1, Previous Address = 0
-            for o in items:
+            # Address(es) table page = priority 2, others = 1, Previous Address = 0
+            for i, o in enumerate(items):
                 if o.get("page_number") in addresses_table_pages and not is_from_previous_address(o):
-                    o["_tu_priority"] = 2
+                    priorities[i] = 2
                 elif is_from_previous_address(o):
-                    o["_tu_priority"] = 0  # Will be filtered out by sorting
-                else:
-                    o["_tu_priority"] = 1
+                    priorities[i] = 0  # Will be sorted last
         else:
             # No Address(es) table found - mark Previous Address as lower priority
-            for o in items:
+            for i, o in enumerate(items):
                 if is_from_previous_address(o):
-                    o["_tu_priority"] = 0
-                else:
-                    o["_tu_priority"] = 1
-    
+                    priorities[i] = 0
+
     # Full name: prioritize Personal Information section
     if field_key == "consumer.full_name":
-        for o in items:
+        for i, o in enumerate(items):
             if is_from_personal_information(o):
-                o["_tu_priority"] = 2
-            else:
-                o["_tu_priority"] = 1
-    
-    # Set default priority for items that don't match any rule
-    for o in items:
-        if "_tu_priority" not in o:
-            o["_tu_priority"] = 1
-    
-    return items
+                priorities[i] = 2
+
+    return priorities